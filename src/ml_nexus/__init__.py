@@ -196,6 +196,8 @@ def __load_default_design():
         new_LocalDockerClient=injected(LocalDockerClient),
         new_RemoteDockerClient=injected(RemoteDockerClient),
         ml_nexus_debug_docker_build=True,
+        # Image refs passed to `docker build --cache-from` (BuildKit), e.g. a registry cache image
+        ml_nexus_docker_cache_from=(),
         # Docker build context configuration (e.g., 'zeus', 'default', 'colima')
         # ml_nexus_docker_build_context=ml_nexus_get_env(
         #     "ML_NEXUS_DOCKER_BUILD_CONTEXT", None
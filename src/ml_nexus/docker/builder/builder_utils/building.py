@@ -26,7 +26,7 @@ from ml_nexus.docker.builder.macros.macro_defs import (
 )
 from ml_nexus.path_util import path_hash
 from ml_nexus.rsync_util import RsyncArgs
-from ml_nexus.util import PsResult
+from ml_nexus.util import CommandException, PsResult
 
 
 @injected
@@ -213,6 +213,7 @@ async def a_build_docker(
     a_system,
     ml_nexus_debug_docker_build,
     ml_nexus_docker_build_context,
+    ml_nexus_docker_cache_from: tuple[str, ...],
     logger,
     /,
     tag,
@@ -227,8 +228,16 @@ async def a_build_docker(
         logger.info(f"Using Docker context: {ml_nexus_docker_build_context}")
         docker_cmd = f"docker --context {ml_nexus_docker_build_context}"
 
-    # Execute docker build
-    build_cmd = f"{docker_cmd} build {options} -t {tag} {context_dir}"
+    if ml_nexus_docker_cache_from:
+        # pull unchanged layers from previously pushed images, and embed the cache
+        # metadata in this image so it can serve as a --cache-from source in turn
+        options += "".join(f" --cache-from={ref}" for ref in ml_nexus_docker_cache_from)
+        options += " --build-arg BUILDKIT_INLINE_CACHE=1"
+
+    # Execute docker build. BuildKit is requested explicitly: the generated
+    # Dockerfiles rely on RUN --mount=type=cache, and pre-23 daemons default to
+    # the legacy builder, which also ignores the inline cache metadata.
+    build_cmd = f"DOCKER_BUILDKIT=1 {docker_cmd} build {options} -t {tag} {context_dir}"
     logger.debug(f"Executing build command: {build_cmd}")
     await a_system(build_cmd)
 
@@ -410,6 +419,7 @@ async def prepare_build_context_with_macro(
                 await asyncio.sleep(100000)
             context_hash = await a_calculate_build_context_hash(tmpdir)
             logger.debug(f"Build context hash: {context_hash}")
+            cxt.context_hash = context_hash
             async with docker_build_keyed_lock.lock(str(dockerfile_path)):
                 yield cxt
         finally:
@@ -471,11 +481,29 @@ def f_docker_login(
     return Future(task)
 
 
+@instance
+async def docker_build_digest_cache() -> Optional[dict[tuple, str]]:
+    """
+    Disabled (None) by default. Override with a dict to opt in.
+    The dict maps (docker context, build options, build context hash) to the ID of the image built from it.
+    The build context hash covers the Dockerfile and every COPYed file,
+    so an identical context can be re-tagged instead of rebuilt.
+    Image IDs are stored rather than tags, since a tag can be moved by a later build.
+    The key does not cover upstream refs (base image tags, --pull, cache-from),
+    so only enable it where those are known not to move, e.g. within a test session.
+    """
+    return None
+
+
 @injected
 async def build_image_with_macro(
     a_build_docker,
     prepare_build_context_with_macro,
     f_docker_login: Future,
+    a_system,
+    logger,
+    ml_nexus_docker_build_context,
+    docker_build_digest_cache: Optional[dict],
     /,
     code: list[Union[str, Block, RCopy, RsyncArgs]],
     tag,
@@ -486,10 +514,25 @@ async def build_image_with_macro(
 ):
     await f_docker_login
     assert isinstance(code, list), f"code must be a list of macro. but got {type(code)}"
+    docker_cmd = "docker"
+    if ml_nexus_docker_build_context:
+        docker_cmd = f"docker --context {ml_nexus_docker_build_context}"
     async with prepare_build_context_with_macro(code) as cxt:
         cxt: BuildMacroContext
         cmd_options = options if options else ""
         cmd_options += " --no-cache" if not use_cache else ""
+        digest_key = (ml_nexus_docker_build_context, cmd_options, cxt.context_hash)
+        caching = docker_build_digest_cache is not None and use_cache and not push
+        if caching and digest_key in docker_build_digest_cache:
+            image_id = docker_build_digest_cache[digest_key]
+            try:
+                # a later build may have moved the tag; point it back at the cached image
+                await a_system(f"{docker_cmd} tag {image_id} {tag}")
+                logger.info(f"Build context unchanged, reusing {image_id} for {tag}")
+                return tag
+            except CommandException:
+                logger.warning(f"Cached image {image_id} is gone, rebuilding {tag}")
+                del docker_build_digest_cache[digest_key]
         await a_build_docker(
             tag=tag,
             context_dir=cxt.build_dir,
@@ -497,6 +540,16 @@ async def build_image_with_macro(
             push=push,
             build_id=build_id,
         )
+        if caching:
+            try:
+                inspected = await a_system(
+                    f"{docker_cmd} image inspect -f '{{{{.Id}}}}' {tag}"
+                )
+            except CommandException:
+                # e.g. a buildx driver without --load, or a build on another host
+                logger.warning(f"{tag} is not in the local image store, not caching it")
+            else:
+                docker_build_digest_cache[digest_key] = inspected.stdout.strip()
         return tag
 
 
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Union, Callable, Awaitable
+from typing import Union, Callable, Awaitable, Optional
 
 from ml_nexus.rsync_util import RsyncArgs
 
@@ -19,6 +19,7 @@ class RCopy:
 @dataclass
 class BuildMacroContext:
     build_dir: Path
+    context_hash: Optional[str] = None
 
 
 PureMacro = Union[str, Block, RCopy, RsyncArgs, list["Macro"]]
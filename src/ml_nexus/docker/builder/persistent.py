@@ -1,9 +1,13 @@
 import asyncio
 import base64
 import json
+import re
+import shutil
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Optional, Union
 
 import pandas as pd
 from pinjected import *
@@ -55,6 +59,9 @@ class PersistentDockerEnvFromSchematics(IScriptRunner):
     _env_result_download_path: Path
     _a_docker_ps: callable
     _ml_nexus_docker_build_context: str
+    _ml_nexus_system_call_event_bus: callable
+    _ml_nexus_system_call_semaphore: asyncio.Semaphore
+    _ml_nexus_default_subprocess_limit: int
 
     project: ProjectDef
     schematics: ContainerSchematic
@@ -70,6 +77,8 @@ class PersistentDockerEnvFromSchematics(IScriptRunner):
         )
         self.container_task = None
         self.container_wait_lock = asyncio.Lock()
+        # serializes ensure_container so concurrent run_script calls start at most one container
+        self.ensure_lock = asyncio.Lock()
 
     def _get_docker_cmd(self) -> str:
         """Get docker command with context if specified"""
@@ -79,57 +88,111 @@ class PersistentDockerEnvFromSchematics(IScriptRunner):
 
     async def a_is_container_ready(self):
         async with self.container_wait_lock:
-            # self._logger.info(f"Checking if container {self.container_name} is ready")
-            ps_table = await self._a_docker_ps(docker_host=self.docker_host)
-            # self._logger.info(f"ps_table: {ps_table}")
-            if self.container_name not in ps_table.index:
-                # self._logger.warning(f"Container {self.container_name} not found in ps table")
-                return False
-            # self._logger.info(f"Container {self.container_name} found in ps table:{ps_table.index}")
-            row = ps_table.loc[self.container_name]
-            # self._logger.info(f"Container {self.container_name} row: {row}")
-            state = row["State"]
-            # self._logger.info(f"Container {self.container_name} status: {status}")
-            return state == "running"
-
-    async def a_wait_container_ready(self):
-        while not await self.a_is_container_ready():
-            await asyncio.sleep(1)
+            # a single inspect of this container instead of listing every container via docker ps
+            docker_cmd = self._get_docker_cmd()
+            proc = await asyncio.create_subprocess_shell(
+                f"{docker_cmd} inspect -f '{{{{.State.Running}}}}' {self.container_name}",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            stdout, _ = await proc.communicate()
+            return proc.returncode == 0 and stdout.decode().strip() == "true"
 
-    async def ensure_container(self):
-        # check if the container is running
+    async def a_container_exists(self) -> bool:
+        """Whether the container exists (running or not), via one docker inspect"""
+        docker_cmd = self._get_docker_cmd()
+        proc = await asyncio.create_subprocess_shell(
+            f"{docker_cmd} inspect -f '{{{{.Name}}}}' {self.container_name}",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        return (await proc.wait()) == 0
+
+    async def a_wait_container_ready(self, recheck_interval: float = 30):
+        """
+        Wait for the container's start event from `docker events` instead of polling.
+        A running container returns after one inspect, without opening the subscription.
+        Otherwise the state is re-checked once subscribed, so a start in between is not missed,
+        and again every recheck_interval seconds in case the event was.
+        """
         if await self.a_is_container_ready():
-            self._logger.info(f"Container {self.container_name} is already running")
-        else:
-            self._logger.warning(
-                f"Container {self.container_name} is not running. Starting..."
-            )
-            self.container_task = asyncio.create_task(
-                self.container.run_script_without_init("sleep infinity")
-            )
-        await self.a_wait_container_ready()
-        await self.container.prepare_mounts()  # ensuring source/resource uploads
-        self._logger.info(f"Container {self.container_name} is ready")
+            return
+        docker_cmd = self._get_docker_cmd()
+        events = await asyncio.create_subprocess_shell(
+            f"{docker_cmd} events --filter container={self.container_name} "
+            f"--filter event=start --format '{{{{.Status}}}}'",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            while not await self.a_is_container_ready():
+                if self.container_task is not None and self.container_task.done():
+                    # surfaces build/run failures instead of waiting forever
+                    self.container_task.result()
+                try:
+                    line = await asyncio.wait_for(
+                        events.stdout.readline(), timeout=recheck_interval
+                    )
+                except asyncio.TimeoutError:
+                    continue
+                if not line:
+                    # docker events exited; fall back to polling
+                    await asyncio.sleep(1)
+        finally:
+            if events.returncode is None:
+                events.kill()
+                await events.wait()
 
-    async def run_script(self, script: str) -> "PsResult":
+    async def ensure_container(self):
+        async with self.ensure_lock:
+            # check if the container is running
+            if await self.a_is_container_ready():
+                self._logger.info(f"Container {self.container_name} is already running")
+            else:
+                self._logger.warning(
+                    f"Container {self.container_name} is not running. Starting..."
+                )
+                self.container_task = asyncio.create_task(
+                    self.container.run_script_without_init("sleep infinity")
+                )
+                await self.a_wait_container_ready()
+            await self.container.prepare_mounts()  # ensuring source/resource uploads
+            self._logger.info(f"Container {self.container_name} is ready")
+
+    async def run_script(
+        self, script: str, expect: Optional[Union[str, re.Pattern]] = None
+    ) -> "PsResult":
         """
         1. ensure the container is running
         2. send base64 encoded script and run it via docker exec
+        With expect, stdout is streamed and the call returns as soon as a line
+        contains expect (or matches it, for a compiled pattern).
+        """
+        return await self.run_script_bytes(script.encode("utf-8"), expect=expect)
+
+    async def run_script_bytes(
+        self, script: bytes, expect: Optional[Union[str, re.Pattern]] = None
+    ) -> "PsResult":
+        """
+        Same as run_script, for scripts that are already encoded.
+        Lets callers keep a module-level bytes constant instead of re-encoding per call.
         """
         await self.ensure_container()
         # Now let's build the script and run it.
 
-        init_script = "\n".join(self.schematics.builder.scripts)
+        init_script = "\n".join(self.schematics.builder.scripts).encode("utf-8")
 
-        final_script = f"""
-{init_script}
-{script}
-"""
-        base64_encoded_script = base64.b64encode(final_script.encode("utf-8")).decode()
-        docker_cmd = self._get_docker_cmd()
-        cmd = f"{docker_cmd} exec {self.container_name} bash /usr/local/bin/base64_runner.sh {base64_encoded_script}"
+        final_script = b"\n" + init_script + b"\n" + script + b"\n"
+        base64_encoded_script = base64.b64encode(final_script).decode()
+        runner = f"bash /usr/local/bin/base64_runner.sh {base64_encoded_script}"
         # await self._a_system(f'ssh {self.docker_host} {cmd}')
-        result = await self._a_system(cmd)
+        if expect is None:
+            docker_cmd = self._get_docker_cmd()
+            result = await self._a_system(
+                f"{docker_cmd} exec {self.container_name} {runner}"
+            )
+        else:
+            result = await self._a_run_until(runner, expect)
 
         if result.exit_code != 0:
             from ml_nexus.util import CommandException
@@ -140,12 +203,112 @@ class PersistentDockerEnvFromSchematics(IScriptRunner):
                 stdout=result.stdout,
                 stderr=result.stderr,
             )
+        if expect is not None and not self._matches(expect, result.stdout):
+            from ml_nexus.util import CommandException
+
+            raise CommandException(
+                f"Script finished without printing {expect!r}",
+                code=result.exit_code,
+                stdout=result.stdout,
+                stderr=result.stderr,
+            )
         return result
 
-    async def stop(self):
+    @staticmethod
+    def _matches(expect: Union[str, re.Pattern], text: str) -> bool:
+        if isinstance(expect, re.Pattern):
+            return expect.search(text) is not None
+        return expect in text
+
+    async def _a_run_until(
+        self, runner: str, expect: Union[str, re.Pattern]
+    ) -> "PsResult":
+        """
+        docker exec runner, reading stdout line by line, and stop it at the first line matching expect.
+        A match counts as success (exit_code=0). Terminating the docker client alone would leave
+        the script running in the container, so every process of the run is killed there too.
+        Output is reported to the system call event bus like _a_system does.
+        """
+        from ml_nexus.util import (
+            PsResult,
+            SystemCallEnd,
+            SystemCallStart,
+            SystemCallStdOut,
+            yield_from_stream_safe,
+        )
+
+        # exported to the runner and inherited by everything it starts, to find them for the kill
+        run_id = uuid.uuid4().hex[:12]
+        docker_cmd = self._get_docker_cmd()
+        cmd = (
+            f"{docker_cmd} exec -e ML_NEXUS_RUN_ID={run_id} "
+            f"{self.container_name} {runner}"
+        )
+        await self._ml_nexus_system_call_event_bus(
+            SystemCallStart(id=run_id, command=cmd)
+        )
+        # the kill below goes through _a_system, which takes the semaphore itself,
+        # so it is held only while the run is being read
+        async with self._ml_nexus_system_call_semaphore:
+            proc = await asyncio.create_subprocess_shell(
+                cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                stdin=asyncio.subprocess.DEVNULL,
+                limit=self._ml_nexus_default_subprocess_limit,
+            )
+
+            async def read_stderr() -> str:
+                # drained concurrently so a chatty script cannot block on a full pipe
+                lines = []
+                async for raw in yield_from_stream_safe(proc.stderr):
+                    await self._ml_nexus_system_call_event_bus(
+                        SystemCallStdOut(id=run_id, command=cmd, text=raw)
+                    )
+                    lines.append(raw.decode("utf-8", errors="replace"))
+                return "".join(lines)
+
+            stderr_task = asyncio.create_task(read_stderr())
+            lines = []
+            matched = False
+            async for raw in yield_from_stream_safe(proc.stdout):
+                await self._ml_nexus_system_call_event_bus(
+                    SystemCallStdOut(id=run_id, command=cmd, text=raw)
+                )
+                line = raw.decode("utf-8", errors="replace")
+                lines.append(line)
+                if self._matches(expect, line):
+                    matched = True
+                    break
+        if matched and proc.returncode is None:
+            await self._a_system(
+                f"{docker_cmd} exec {self.container_name} sh -c "
+                f"'for f in $(grep -l ML_NEXUS_RUN_ID={run_id} /proc/[0-9]*/environ 2>/dev/null); "
+                f"do p=${{f#/proc/}}; kill ${{p%/environ}} 2>/dev/null; done; true'"
+            )
+            if proc.returncode is None:
+                proc.terminate()
+        await proc.wait()
+        stderr = await stderr_task
+        exit_code = 0 if matched else proc.returncode
+        await self._ml_nexus_system_call_event_bus(
+            SystemCallEnd(id=run_id, command=cmd, code=exit_code)
+        )
+        return PsResult(stdout="".join(lines), stderr=stderr, exit_code=exit_code)
+
+    async def stop(self, timeout: int = 10):
+        """
+        Stop the container, waiting up to `timeout` seconds after SIGTERM.
+        timeout=0 removes it with `docker rm -f`, skipping the grace period.
+        """
         # await self._a_system(f"ssh {self.docker_host} docker stop {self.container_name}")
         docker_cmd = self._get_docker_cmd()
-        await self._a_system(f"{docker_cmd} stop {self.container_name}")
+        if timeout == 0:
+            await self._a_system(f"{docker_cmd} rm -f {self.container_name}")
+        else:
+            await self._a_system(
+                f"{docker_cmd} stop --time={timeout} {self.container_name}"
+            )
 
     async def upload(self, local_path: Path, remote_path: Path):
         await self.ensure_container()
@@ -160,6 +323,20 @@ class PersistentDockerEnvFromSchematics(IScriptRunner):
             f"{docker_cmd} cp {local_path} {self.container_name}:{remote_path}"
         )
 
+    async def upload_bytes(self, data: bytes, remote_path: Path):
+        """
+        Write data to remote_path without staging a local file.
+        Uses one docker exec instead of mkdir + docker cp. The payload is passed
+        base64 encoded on the command line like run_script, so keep it small.
+        """
+        await self.ensure_container()
+        encoded = base64.b64encode(data).decode()
+        docker_cmd = self._get_docker_cmd()
+        await self._a_system(
+            f"{docker_cmd} exec {self.container_name} sh -c "
+            f"'mkdir -p {remote_path.parent} && echo {encoded} | base64 -d > {remote_path}'"
+        )
+
     async def download(self, remote_path: Path, local_path: Path):
         await self.ensure_container()
         docker_cmd = self._get_docker_cmd()
@@ -189,6 +366,30 @@ class PersistentDockerEnvFromSchematics(IScriptRunner):
             f"rsync -avz -e '{docker_cmd} exec -i' {local_path} {self.container_name}:{remote_path}"
         )
 
+    async def sync_to_container_batch(self, entries: list[tuple[Path, Path]]):
+        """
+        Copy several local files/directories into the container through one
+        tar stream, instead of opening a docker cp/rsync connection per entry.
+        Each local path ends up at its paired (absolute) remote path.
+        """
+        await self.ensure_container()
+        docker_cmd = self._get_docker_cmd()
+        with TemporaryDirectory() as staging:
+            staging = Path(staging)
+            for local_path, remote_path in entries:
+                assert remote_path.is_absolute(), f"{remote_path} must be absolute"
+                dst = staging / remote_path.relative_to("/")
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                if local_path.is_dir():
+                    shutil.copytree(local_path, dst, dirs_exist_ok=True)
+                else:
+                    shutil.copy2(local_path, dst)
+            # --no-overwrite-dir keeps the metadata of existing dirs such as / and /tmp
+            await self._a_system(
+                f"tar -C {staging} -cf - . | {docker_cmd} exec -i {self.container_name} "
+                f"tar -xf - -C / --no-overwrite-dir"
+            )
+
     def random_remote_path(self):
         tmp_name = uuid.uuid4().hex[:8]
         return self.project.placement.resources_root / "tmp" / tmp_name
@@ -27,13 +27,19 @@ ProjectKind = Literal[
 ]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProjectDir:
     id: str
     kind: ProjectKind = "auto"
-    dependencies: list["ProjectDir"] = field(default_factory=list)
-    excludes: list[str] = field(default_factory=list)
-    extra_dependencies: list["PlatformDependantPypi"] = field(default_factory=list)
+    dependencies: tuple["ProjectDir", ...] = ()
+    excludes: tuple[str, ...] = ()
+    extra_dependencies: tuple["PlatformDependantPypi", ...] = ()
+
+    def __post_init__(self):
+        # accept lists from callers, but store tuples so that the instance is hashable
+        object.__setattr__(self, "dependencies", tuple(self.dependencies))
+        object.__setattr__(self, "excludes", tuple(self.excludes))
+        object.__setattr__(self, "extra_dependencies", tuple(self.extra_dependencies))
 
     def project_dirs(self):
         for dep in self.dependencies:
@@ -57,23 +63,28 @@ DEFAULT_PLACEMENT = ProjectPlacement(
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlatformDependantPypi:
     system: str
     package: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProjectDef:
-    dirs: list[ProjectDir]
+    dirs: tuple[ProjectDir, ...]
     placement: ProjectPlacement = DEFAULT_PLACEMENT
     default_working_dir: Optional[Path] = None
 
     def __post_init__(self):
+        object.__setattr__(self, "dirs", tuple(self.dirs))
         if not self.dirs:
-            self.default_working_dir = Path("/")
+            object.__setattr__(self, "default_working_dir", Path("/"))
         if self.default_working_dir is None:
-            self.default_working_dir = self.placement.sources_root / self.dirs[0].id
+            object.__setattr__(
+                self,
+                "default_working_dir",
+                self.placement.sources_root / self.dirs[0].id,
+            )
 
     def yield_project_dirs(self):
         for dir in self.dirs:
@@ -3,7 +3,15 @@ from dataclasses import field, dataclass
 from hashlib import sha256
 from itertools import chain
 from pathlib import Path
-from typing import Optional, List, Protocol, Callable, Sequence, TYPE_CHECKING
+from typing import (
+    Optional,
+    List,
+    Protocol,
+    Callable,
+    Sequence,
+    Awaitable,
+    TYPE_CHECKING,
+)
 
 from beartype import beartype
 from loguru import logger
@@ -49,13 +57,22 @@ async def a_hf_cache_component(
     )
 
 
+# Keeps downloaded .deb files in a BuildKit cache across builds. The images'
+# docker-clean hook would delete them after every install, so it is removed
+# first. /var/lib/apt stays in the layer so runtime apt-get calls still work.
+APT_CACHE_RUN = (
+    "RUN --mount=type=cache,target=/var/cache/apt,sharing=locked "
+    "rm -f /etc/apt/apt.conf.d/docker-clean &&"
+)
+
+
 @instance
 async def base_apt_packages_component() -> EnvComponent:
     return EnvComponent(
         installation_macro=[
             "ENV DEBIAN_FRONTEND=noninteractive",
             # Install all dependencies required by pyenv to build Python from source
-            "RUN apt-get update && apt-get install -y python3-pip python3-dev build-essential libssl-dev curl git clang rsync \
+            f"{APT_CACHE_RUN} apt-get update && apt-get install -y python3-pip python3-dev build-essential libssl-dev curl git clang rsync \
                 zlib1g-dev libbz2-dev libreadline-dev libsqlite3-dev wget llvm libncurses5-dev libncursesw5-dev \
                 xz-utils tk-dev libffi-dev liblzma-dev python3-openssl",
         ],
@@ -133,7 +150,7 @@ async def a_pyenv_component_embedded(
     pyenv_install_macros = [
         # Install build dependencies
         f"""
-RUN apt-get update && apt-get install -y make build-essential libssl-dev zlib1g-dev \\
+{APT_CACHE_RUN} apt-get update && apt-get install -y make build-essential libssl-dev zlib1g-dev \\
             libbz2-dev libreadline-dev libsqlite3-dev wget curl llvm \\
             libncursesw5-dev xz-utils tk-dev libxml2-dev libxmlsec1-dev \\
             libffi-dev liblzma-dev git
@@ -165,8 +182,9 @@ RUN apt-get update && apt-get install -y make build-essential libssl-dev zlib1g-
                 dst=Path(target.default_working_dir) / "requirements.txt",
             ),
             f"WORKDIR {target.default_working_dir}",
-            # Activate venv and install requirements (with pip cache for faster rebuilds)
-            f'RUN --mount=type=cache,target=/root/pip_cache/pip bash -c \'eval "$(pyenv init --path)" && eval "$(pyenv init -)" && source {venv_path}/bin/activate && pip install --upgrade pip && pip install -r requirements.txt\'',
+            # Activate venv and install requirements (with pip cache for faster rebuilds).
+            # PIP_CACHE_DIR is only exported at runtime, so the build uses pip's default.
+            f'RUN --mount=type=cache,target=/root/.cache/pip bash -c \'eval "$(pyenv init --path)" && eval "$(pyenv init -)" && source {venv_path}/bin/activate && pip install --upgrade pip && pip install -r requirements.txt\'',
         ]
 
     # Copy all project files (excluding common build artifacts)
@@ -204,7 +222,7 @@ RUN apt-get update && apt-get install -y make build-essential libssl-dev zlib1g-
     if setup_py_path.exists():
         # Activate venv and install package
         final_install.append(
-            f'RUN --mount=type=cache,target=/root/pip_cache/pip bash -c \'eval "$(pyenv init --path)" && eval "$(pyenv init -)" && source {venv_path}/bin/activate && cd {target.default_working_dir} && pip install -e .\''
+            f'RUN --mount=type=cache,target=/root/.cache/pip bash -c \'eval "$(pyenv init --path)" && eval "$(pyenv init -)" && source {venv_path}/bin/activate && cd {target.default_working_dir} && pip install -e .\''
         )
 
     # For embedded components, pyenv is already installed in the image
@@ -296,8 +314,8 @@ async def a_uv_pip_component_embedded(
                 dst=Path(target.default_working_dir) / "requirements.txt",
             ),
             f"WORKDIR {target.default_working_dir}",
-            # Activate venv and install requirements using uv pip
-            f'RUN --mount=type=cache,target=/root/.cache/pip bash -c "source $HOME/.cargo/env && source {venv_path}/bin/activate && uv pip install --upgrade pip && uv pip install -r requirements.txt"',
+            # Activate venv and install requirements using uv pip (uv caches under ~/.cache/uv)
+            f'RUN --mount=type=cache,target=/root/.cache/uv bash -c "source $HOME/.cargo/env && source {venv_path}/bin/activate && uv pip install --upgrade pip && uv pip install -r requirements.txt"',
         ]
 
     # Copy all project files (excluding common build artifacts)
@@ -335,7 +353,7 @@ async def a_uv_pip_component_embedded(
     if setup_py_path.exists():
         # Activate venv and install package using uv pip
         final_install.append(
-            f'RUN --mount=type=cache,target=/root/.cache/pip bash -c "source $HOME/.cargo/env && source {venv_path}/bin/activate && cd {target.default_working_dir} && uv pip install -e ."'
+            f'RUN --mount=type=cache,target=/root/.cache/uv bash -c "source $HOME/.cargo/env && source {venv_path}/bin/activate && cd {target.default_working_dir} && uv pip install -e ."'
         )
 
     # Activation script for runtime
@@ -467,7 +485,7 @@ async def a_rye_component(
 async def rust_cargo_component() -> EnvComponent:
     return EnvComponent(
         installation_macro=[
-            "RUN apt-get update && apt-get install -y curl",
+            f"{APT_CACHE_RUN} apt-get update && apt-get install -y curl",
             "RUN curl https://sh.rustup.rs -sSf | sh -s -- -y",
         ]
     )
@@ -720,7 +738,10 @@ async def a_component_to_install_requirements_txt_embedded(
     # Install dependencies in build stage with cache mount
     common_packages_str = " ".join([f"'{pkg}'" for pkg in common_packages if pkg])
     special_install_lines = "\n".join(
-        [f"RUN pip install {p} --no-dependencies" for p in special_packages]
+        [
+            f"RUN --mount=type=cache,target=/root/.cache/pip pip install {p} --no-dependencies"
+            for p in special_packages
+        ]
     )
 
     dependency_install_macro = [
@@ -772,6 +793,54 @@ async def a_component_to_install_requirements_txt_embedded(
     )
 
 
+@instance
+def embedded_component_cache() -> dict[tuple, asyncio.Future]:
+    """
+    Embedded components for the same (kind, target, python_version, project inputs) are identical,
+    so schematics_universal resolves each of them once per injector.
+    The key includes _a_embedded_inputs_hash, so editing a dependency file resolves the component again.
+    """
+    return dict()
+
+
+# Project files the embedded components read or check for while resolving.
+# Everything else is only referenced by RCopy/rsync macros and read at build time.
+_EMBEDDED_COMPONENT_INPUTS = (
+    "requirements.txt",
+    "setup.py",
+    "pyproject.toml",
+    "uv.lock",
+    "Cargo.toml",
+    "Cargo.lock",
+)
+
+
+async def _a_embedded_inputs_hash(
+    storage_resolver: IStorageResolver, target: ProjectDef
+) -> str:
+    local_project_dir = await storage_resolver.locate(target.dirs[0].id)
+    digest = sha256()
+    for name in _EMBEDDED_COMPONENT_INPUTS:
+        path = local_project_dir / name
+        digest.update(name.encode())
+        digest.update(path.read_bytes() if path.is_file() else b"\0missing")
+    return digest.hexdigest()
+
+
+async def _a_cached_component(
+    cache: dict[tuple, asyncio.Future],
+    key: tuple,
+    factory: Callable[[], Awaitable[EnvComponent]],
+) -> EnvComponent:
+    if key not in cache:
+        cache[key] = asyncio.ensure_future(factory())
+    try:
+        return await cache[key]
+    except Exception:
+        cache.pop(key, None)
+        raise
+
+
 class SchematicsUniversal(Protocol):
     async def __call__(
         self,
@@ -801,6 +870,7 @@ async def schematics_universal(
     a_get_mount_request_for_pdir: Callable,
     a_component_to_install_requirements_txt: Callable,
     a_component_to_install_requirements_txt_embedded: Callable,
+    embedded_component_cache: dict,
     /,
     target: ProjectDef,
     base_image: Optional[str] = None,
@@ -812,20 +882,24 @@ async def schematics_universal(
     setup_script_with_deps: SetupScriptWithDeps = (
         await a_prepare_setup_script_with_deps(target)
     )
-    python_components = []
-    for dep in setup_script_with_deps.env_deps:
+
+    inputs_hash = None
+    if any(dep.endswith("-embedded") for dep in setup_script_with_deps.env_deps):
+        inputs_hash = await _a_embedded_inputs_hash(storage_resolver, target)
+
+    async def a_component_for(dep: str) -> Optional[EnvComponent]:
         match dep:
             case "pyvenv":
-                python_components.append(
-                    await a_pyenv_component(
-                        target=target, python_version=python_version
-                    )
+                return await a_pyenv_component(
+                    target=target, python_version=python_version
                 )
             case "pyvenv-embedded":
-                python_components.append(
-                    await a_pyenv_component_embedded(
+                return await _a_cached_component(
+                    embedded_component_cache,
+                    (dep, target, python_version, inputs_hash),
+                    lambda: a_pyenv_component_embedded(
                         target=target, python_version=python_version
-                    )
+                    ),
                 )
             case "requirements.txt":
                 """
@@ -834,45 +908,57 @@ async def schematics_universal(
                 We might need a dedicated uv project initialization, instead of using direct requirements.
                 That's a TODO for now.
                 """
-                python_components.append(
-                    await a_component_to_install_requirements_txt(target=target)
-                )
+                return await a_component_to_install_requirements_txt(target=target)
             case "requirements.txt-embedded":
-                python_components.append(
-                    await a_component_to_install_requirements_txt_embedded(
+                return await _a_cached_component(
+                    embedded_component_cache,
+                    (dep, target, inputs_hash),
+                    lambda: a_component_to_install_requirements_txt_embedded(
                         target=target
-                    )
+                    ),
                 )
             case "setup.py":
-                python_components.append(
-                    EnvComponent(
-                        init_script=[
-                            f"cd {target.default_working_dir}",
-                            "pip install -e .",
-                        ]
-                    )
+                return EnvComponent(
+                    init_script=[
+                        f"cd {target.default_working_dir}",
+                        "pip install -e .",
+                    ]
                 )
             case "rye":
                 local_project_dir = await storage_resolver.locate(target.dirs[0].id)
-                python_components.append(
-                    await a_rye_component(
-                        project_workdir=target.default_working_dir,
-                        local_project_dir=local_project_dir,
-                    )
+                return await a_rye_component(
+                    project_workdir=target.default_working_dir,
+                    local_project_dir=local_project_dir,
                 )
             case "uv":
-                python_components.append(await a_uv_component(target=target))
+                return await a_uv_component(target=target)
             case "uv-embedded":
-                python_components.append(await a_uv_component_embedded(target=target))
+                return await _a_cached_component(
+                    embedded_component_cache,
+                    (dep, target, inputs_hash),
+                    lambda: a_uv_component_embedded(target=target),
+                )
             case "uv-pip-embedded":
-                python_components.append(
-                    await a_uv_pip_component_embedded(
+                return await _a_cached_component(
+                    embedded_component_cache,
+                    (dep, target, python_version, inputs_hash),
+                    lambda: a_uv_pip_component_embedded(
                         target=target, python_version=python_version
-                    )
+                    ),
                 )
             case "poetry":
                 raise NotImplementedError("poetry is not supported yet")
 
+    # the components do not depend on each other, so resolve them concurrently.
+    # gather keeps env_deps order; deps without a component (no case) are skipped.
+    python_components = [
+        component
+        for component in await asyncio.gather(
+            *[a_component_for(dep) for dep in setup_script_with_deps.env_deps]
+        )
+        if component is not None
+    ]
+
     mounts = await asyncio.gather(
         *[
             a_get_mount_request_for_pdir(placement=target.placement, pdir=pdir)
@@ -0,0 +1,57 @@
+"""Design shared by the zeus-backed embedded tests
+
+The storage resolver, the docker build cache and the load_env_design merge
+are built once here and reused by every test module that imports COMMON_DESIGN.
+"""
+
+import os
+from pathlib import Path
+
+from loguru import logger
+from pinjected import design
+
+from ml_nexus import load_env_design
+from ml_nexus.storage_resolver import StaticStorageResolver
+
+TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
+
+DUMMY_PROJECTS = [
+    "test_requirements",
+    "test_resource",
+    "test_rye",
+    "test_setuppy",
+    "test_source",
+    "test_uv",
+]
+
+# One Path per dummy project, shared by both resolvers below
+_PROJECT_PATHS = {name: TEST_PROJECT_ROOT / name for name in DUMMY_PROJECTS}
+
+# Resolves the "test/dummy_projects/<name>" ids used by the embedded tests
+SHARED_RESOLVER = StaticStorageResolver(
+    {f"test/dummy_projects/{name}": path for name, path in _PROJECT_PATHS.items()}
+)
+
+# Resolves the bare "<name>" ids used by the schematics and persistent env tests
+SHORT_NAME_RESOLVER = StaticStorageResolver(dict(_PROJECT_PATHS))
+
+# docker_build_digest_cache is disabled by default; the tests opt in with one
+# dict shared by every injector, so a schematic whose build context is
+# unchanged is re-tagged instead of rebuilt.
+# It maps build contexts to image IDs, not tags, so it is safe to share between
+# modules whose schematics reuse a tag: a hit points the tag back at its image.
+SESSION_BUILD_CACHE: dict[tuple, str] = {}
+
+# Comma separated image refs to seed BuildKit's layer cache from, e.g. a
+# registry image pushed by CI. Empty by default, so builds stay local.
+TEST_DOCKER_CACHE_FROM = tuple(
+    ref for ref in os.environ.get("ML_NEXUS_TEST_DOCKER_CACHE_FROM", "").split(",") if ref
+)
+
+COMMON_DESIGN = load_env_design + design(
+    ml_nexus_docker_build_context="zeus",
+    storage_resolver=SHARED_RESOLVER,
+    docker_build_digest_cache=SESSION_BUILD_CACHE,
+    ml_nexus_docker_cache_from=TEST_DOCKER_CACHE_FROM,
+    logger=logger,
+)
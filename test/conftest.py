@@ -4,6 +4,24 @@ This file configures pytest to use the IProxy plugin for discovering
 and running IProxy test objects.
 """
 
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+from functools import cache
+
+import pytest
+from loguru import logger
+
+from test.container_pool import container_pool
+
+# Set ML_NEXUS_KEEP_TEST_CONTAINERS=1 to keep pooled containers for inspection
+KEEP_TEST_CONTAINERS = os.environ.get("ML_NEXUS_KEEP_TEST_CONTAINERS") == "1"
+
+# Set ML_NEXUS_USE_UVLOOP=1 to run the docker-exec heavy tests on uvloop
+USE_UVLOOP = os.environ.get("ML_NEXUS_USE_UVLOOP") == "1"
+
 # Enable the IProxy pytest plugin
 pytest_plugins = ["test.pytest_iproxy_plugin"]
 
@@ -11,5 +29,171 @@ pytest_plugins = ["test.pytest_iproxy_plugin"]
 # Optional: Configure pytest settings
 def pytest_configure(config):
     """Additional pytest configuration"""
-    # Add custom markers or settings if needed
-    pass
+    config.addinivalue_line(
+        "markers",
+        "zeus(host='zeus'): needs the remote docker host, zeus unless given "
+        "(skipped when unreachable)",
+    )
+    if USE_UVLOOP and sys.platform != "win32":
+        import uvloop
+
+        # injected_pytest creates its loops through asyncio, so the policy covers them
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    # Tests log whole container stdout; a plain sink skips colorizing and
+    # frame inspection for every record. Modules keep using loguru's global logger.
+    # enqueue=True hands the stderr write to loguru's worker thread, so dumping a
+    # large result.stdout does not stall the event loop driving the next docker exec.
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level="INFO",
+        format="{level: <8} | {message}",
+        colorize=False,
+        backtrace=False,
+        diagnose=False,
+        enqueue=True,
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """Cap the opt-in `-n auto` so the remote docker daemon is not overwhelmed"""
+    limit = os.environ.get("ML_NEXUS_MAX_DOCKER_CONCURRENCY")
+    if limit is None:
+        return None
+    return min(int(limit), os.cpu_count() or 1)
+
+
+@cache
+def _ssh_config(host: str) -> dict[str, str]:
+    """The options ssh would use for host (`ssh -G`), with ~/.ssh/config aliases resolved"""
+    try:
+        out = subprocess.run(
+            ["ssh", "-G", host], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return {}
+    options = {}
+    for line in out.splitlines():
+        key, _, value = line.partition(" ")
+        options[key] = value
+    return options
+
+
+def _control_path_configured(host: str) -> bool:
+    """Whether ~/.ssh/config gives host a ControlPath the docker context's ssh will reuse"""
+    return _ssh_config(host).get("controlpath", "none") != "none"
+
+
+def _start_ssh_master(host: str) -> bool:
+    """
+    Open one multiplexed ssh connection to host so every `docker --context host`
+    call skips the ssh handshake. Returns whether we own the master.
+    """
+    if not _control_path_configured(host):
+        logger.info(
+            f"{host} has no ssh ControlPath; add 'ControlMaster auto' and "
+            "'ControlPath ~/.ssh/cm-%r@%h:%p' to ~/.ssh/config to share one connection"
+        )
+        return False
+    try:
+        check = subprocess.run(
+            ["ssh", "-O", "check", host], capture_output=True, timeout=10
+        )
+        if check.returncode == 0:
+            # an existing master (not ours) is reused and left alone
+            return False
+        # -f backgrounds ssh while it holds its pipes, so they must not be captured
+        return (
+            subprocess.run(
+                ["ssh", "-o", "ControlMaster=yes", "-o", "ControlPersist=600", "-Nf", host],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=30,
+            ).returncode
+            == 0
+        )
+    except subprocess.TimeoutExpired:
+        logger.warning(f"ssh master for {host} timed out, continuing without it")
+        return False
+
+
+# Base images of the zeus-backed schematics tests, pulled up front in parallel
+PREFETCH_BASE_IMAGES = ("python:3.11-slim", "ubuntu:22.04")
+
+
+def _prefetch_base_images(host: str) -> list[subprocess.Popen]:
+    """Start one background `docker pull` per base image so cold pulls overlap
+    with each other instead of stalling the first builds"""
+    return [
+        subprocess.Popen(
+            ["docker", "--context", host, "pull", "--quiet", image],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        for image in PREFETCH_BASE_IMAGES
+    ]
+
+
+def _marker_host(marker) -> str:
+    return marker.args[0] if marker.args else "zeus"
+
+
+def pytest_collection_finish(session):
+    """Share one ssh connection per docker host and prefetch its base images,
+    only for the hosts that the selected, reachable zeus-marked tests use"""
+    hosts = dict.fromkeys(
+        _marker_host(marker)
+        for item in session.items
+        if (marker := item.get_closest_marker("zeus")) is not None
+    )
+    hosts = [host for host in hosts if _docker_host_available(host)]
+    # an xdist worker must not own a master another worker may be multiplexing on;
+    # prefetching is fine anywhere, the daemon joins concurrent pulls of one image
+    is_xdist_worker = hasattr(session.config, "workerinput")
+    session.config._ml_nexus_ssh_masters = (
+        [] if is_xdist_worker else [host for host in hosts if _start_ssh_master(host)]
+    )
+    session.config._ml_nexus_prefetch = [
+        pull for host in hosts for pull in _prefetch_base_images(host)
+    ]
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Stop the containers kept alive by the persistent container pool"""
+    if KEEP_TEST_CONTAINERS:
+        logger.info("ML_NEXUS_KEEP_TEST_CONTAINERS is set, leaving pooled containers")
+    else:
+        container_pool.close()
+    for pull in getattr(session.config, "_ml_nexus_prefetch", []):
+        if pull.poll() is None:
+            pull.terminate()
+    for host in getattr(session.config, "_ml_nexus_ssh_masters", []):
+        subprocess.run(["ssh", "-O", "exit", host], capture_output=True)
+    # flush records still queued for the enqueue=True sink
+    logger.complete()
+
+
+@cache
+def _docker_host_available(host: str) -> bool:
+    """Probe the ssh port behind host once per session; host may be an ssh alias"""
+    options = _ssh_config(host)
+    address = (options.get("hostname", host), int(options.get("port", 22)))
+    try:
+        socket.create_connection(address, timeout=1.0).close()
+        return True
+    except OSError:
+        return False
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """Skip tests marked zeus up front instead of failing mid-build"""
+    for item in items:
+        marker = item.get_closest_marker("zeus")
+        if marker is None:
+            continue
+        host = _marker_host(marker)
+        if not _docker_host_available(host):
+            item.add_marker(pytest.mark.skip(reason=f"docker host {host} is unreachable"))
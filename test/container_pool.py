@@ -0,0 +1,63 @@
+"""Session-wide pool of persistent test containers
+
+Starting a PersistentDockerEnvFromSchematics container costs a cold
+`docker run` on the remote host. Tests that do not mutate the container
+can acquire it from this pool instead: the first acquire starts it, later
+acquires (by the same container_name) find it already running, and the
+containers are stopped once at the end of the pytest session.
+Pooled containers must be named with session_container_name(), so that no
+other test module (or a parallel session) removes them mid-test.
+
+Each @injected_pytest test runs on its own event loop, so the pool only
+remembers how to reach each container, never loop-bound objects.
+"""
+
+import subprocess
+import uuid
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # conftest imports this module, so keep the docker builders out of its import
+    from ml_nexus.docker.builder.persistent import PersistentDockerEnvFromSchematics
+
+# One id per process, so every xdist worker and concurrent session gets its own names
+_SESSION_ID = uuid.uuid4().hex[:6]
+
+
+def session_container_name(prefix: str) -> str:
+    """Container name that is stable within this session and unique across sessions"""
+    return f"{prefix}_{_SESSION_ID}"
+
+
+class PersistentContainerPool:
+    def __init__(self):
+        # container_name -> docker command used to reach it
+        self._containers: dict[str, str] = {}
+
+    async def acquire(
+        self, docker_env: "PersistentDockerEnvFromSchematics"
+    ) -> "PersistentDockerEnvFromSchematics":
+        """Start the container unless a previous test already did."""
+        await docker_env.ensure_container()
+        self._containers[docker_env.container_name] = docker_env._get_docker_cmd()
+        return docker_env
+
+    async def release(self, docker_env: "PersistentDockerEnvFromSchematics"):
+        """Keep the container running for the next test; see close()."""
+        assert docker_env.container_name in self._containers, (
+            f"container {docker_env.container_name} was not acquired from the pool"
+        )
+
+    def close(self):
+        """Remove every pooled container. Called from pytest_sessionfinish."""
+        for name, docker_cmd in self._containers.items():
+            # rm -f skips docker stop's SIGTERM grace period
+            subprocess.run(
+                f"{docker_cmd} rm -f {name}",
+                shell=True,
+                capture_output=True,
+            )
+        self._containers.clear()
+
+
+container_pool = PersistentContainerPool()
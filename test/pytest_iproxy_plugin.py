@@ -6,10 +6,22 @@ automatically discover and run IProxy objects as test items.
 
 import pytest
 from _pytest.python import Module
-from pinjected import IProxy, design
+from pinjected import IProxy, Injected, design
 from pinjected.test.injected_pytest import _to_pytest
 
 
+_EMPTY_DESIGN = design()
+
+
+def _converted_test(name, obj, module_design, module_file):
+    """Convert an IProxy with _to_pytest into a test function named after it."""
+    test_func = _to_pytest(obj, module_design, module_file)
+    # Mark it as coming from IProxy
+    test_func._iproxy_original = obj
+    test_func.__name__ = name
+    return test_func
+
+
 class IProxyModule(Module):
     """Custom Module collector that handles IProxy objects"""
 
@@ -26,46 +38,67 @@ class IProxyModule(Module):
 
         # Now look for IProxy objects that weren't collected
         module = self.obj
-        module_design = getattr(module, "__meta_design__", design())
+        module_design = getattr(module, "__meta_design__", _EMPTY_DESIGN)
         module_file = str(self.path)
 
-        # Find all attributes in the module
-        for name in dir(module):
+        iproxies = [
+            (name, getattr(module, name))
+            for name in dir(module)
             # Skip if it doesn't look like a test
-            if not name.startswith("test"):
+            if name.startswith("test")
+            and isinstance(getattr(module, name), IProxy)
+        ]
+
+        if self.config.getoption("iproxy_batch") == "module" and len(iproxies) > 1:
+            yield self._batch_item(iproxies, module_design, module_file)
+            return
+
+        for name, obj in iproxies:
+            # Convert each IProxy and create a test item
+            try:
+                # Convert IProxy to pytest function
+                test_func = _converted_test(name, obj, module_design, module_file)
+            except Exception as e:
+                # Create a test that reports the error
+                def error_test(name=name, e=e):
+                    pytest.fail(f"Failed to convert IProxy '{name}': {e}")
+
+                error_test.__name__ = name
+                yield pytest.Function.from_parent(
+                    self, name=name, callobj=error_test
+                )
                 continue
 
-            # Get the object
-            obj = getattr(module, name)
-
-            # Skip Partial objects (@injected functions)
-            if isinstance(obj, Partial):
-                continue
-
-            # If it's an IProxy, convert and create a test item
-            if isinstance(obj, IProxy):
-                try:
-                    # Convert IProxy to pytest function
-                    test_func = _to_pytest(obj, module_design, module_file)
-
-                    # Mark it as coming from IProxy
-                    test_func._iproxy_original = obj
-                    test_func.__name__ = name
-
-                    # Create a pytest Function item
-                    yield pytest.Function.from_parent(
-                        self, name=name, callobj=test_func
-                    )
-
-                except Exception:
-                    # Create a test that reports the error
-                    def error_test():
-                        pytest.fail(f"Failed to convert IProxy '{name}': {e}")
-
-                    error_test.__name__ = name
-                    yield pytest.Function.from_parent(
-                        self, name=name, callobj=error_test
-                    )
+            # Create a pytest Function item
+            yield pytest.Function.from_parent(self, name=name, callobj=test_func)
+
+    def _batch_item(self, iproxies, module_design, module_file):
+        """One test item that resolves every IProxy of the module together.
+
+        A single resolver is built for the whole module and the IProxies are
+        resolved as one Injected.list, so shared dependencies are provided once
+        and independent coroutines overlap. A failure fails the whole batch;
+        use --iproxy-batch=off to see which IProxy broke.
+        """
+        names = [name for name, _ in iproxies]
+        combined = Injected.list(*[obj for _, obj in iproxies]).proxy
+        test_func = _to_pytest(combined, module_design, module_file)
+        test_func._iproxy_original = combined
+        test_func.__name__ = "test_iproxy_batch"
+        test_func.__doc__ = f"IProxy batch: {', '.join(names)}"
+        return pytest.Function.from_parent(
+            self, name="test_iproxy_batch", callobj=test_func
+        )
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--iproxy-batch",
+        dest="iproxy_batch",
+        choices=["off", "module"],
+        default="off",
+        help="module: run all IProxy tests of a module as one item sharing a resolver",
+    )
 
 
 def pytest_pycollect_makeitem(collector, name, obj):
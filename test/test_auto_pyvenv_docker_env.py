@@ -5,25 +5,17 @@ or setup.py, the schematics system correctly sets up a pyvenv environment.
 """
 
 from pathlib import Path
+import pytest
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
 from ml_nexus.docker.builder.docker_env_with_schematics import DockerHostPlacement
 from loguru import logger
+from test._common_design import SHORT_NAME_RESOLVER
 
-# Setup test project paths
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
-
-# Test storage resolver
-_storage_resolver = StaticStorageResolver(
-    {
-        "test_setuppy": TEST_PROJECT_ROOT / "test_setuppy",
-        "test_requirements": TEST_PROJECT_ROOT / "test_requirements",
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-    }
-)
+# Storage resolver for the dummy test projects, shared with other modules
+_storage_resolver = SHORT_NAME_RESOLVER
 
 # Test design configuration
 _test_design = design(
@@ -44,6 +36,7 @@ __design__ = load_env_design + _test_design
 
 
 # ===== Test 1: Auto detection with requirements.txt uses pyvenv =====
+@pytest.mark.zeus
 @injected_pytest
 async def test_auto_requirements_uses_pyvenv(
     schematics_universal, new_DockerEnvFromSchematics, logger
@@ -94,6 +87,7 @@ async def test_auto_requirements_uses_pyvenv(
 
 
 # ===== Test 2: Auto detection with setup.py uses pyvenv =====
+@pytest.mark.zeus
 @injected_pytest
 async def test_auto_setuppy_uses_pyvenv(
     schematics_universal, new_DockerEnvFromSchematics, logger
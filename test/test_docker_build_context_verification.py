@@ -5,6 +5,7 @@ injection is working correctly and Docker builds use the specified context.
 """
 
 from pathlib import Path
+import pytest
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
@@ -43,6 +44,7 @@ async def test_docker_context_injection(ml_nexus_docker_build_context, logger):
 
 
 # ===== Test Docker build with context =====
+@pytest.mark.zeus
 @injected_pytest(test_design)
 async def test_docker_build_with_context(
     new_DockerBuilder, a_build_docker, ml_nexus_docker_build_context, logger
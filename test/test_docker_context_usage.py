@@ -1,6 +1,7 @@
 """Test that Docker context is properly used throughout the codebase"""
 
 from pathlib import Path
+import pytest
 from pinjected import design
 from pinjected.test import injected_pytest
 
@@ -8,6 +9,9 @@ from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
 from ml_nexus.storage_resolver import StaticStorageResolver
 
+# Every test here runs containers on zeus; conftest.py skips them when it is unreachable
+pytestmark = pytest.mark.zeus
+
 
 # Configure static resolver for test directories
 _storage_resolver = StaticStorageResolver(
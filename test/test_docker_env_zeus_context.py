@@ -5,27 +5,19 @@ for building images and runs various scenarios with multiple schematics configur
 """
 
 from pathlib import Path
+import pytest
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.docker.builder.docker_env_with_schematics import DockerHostPlacement
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
-
-# Setup test project paths
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
-
-# Test storage resolver
-_storage_resolver = StaticStorageResolver(
-    {
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-        "test_rye": TEST_PROJECT_ROOT / "test_rye",
-        "test_setuppy": TEST_PROJECT_ROOT / "test_setuppy",
-        "test_requirements": TEST_PROJECT_ROOT / "test_requirements",
-        "test_source": TEST_PROJECT_ROOT / "test_source",
-        "test_resource": TEST_PROJECT_ROOT / "test_resource",
-    }
-)
+from test._common_design import SHORT_NAME_RESOLVER
+
+# Every test here runs containers on zeus; conftest.py skips them when it is unreachable
+pytestmark = pytest.mark.zeus
+
+# Storage resolver for the dummy test projects, shared with other modules
+_storage_resolver = SHORT_NAME_RESOLVER
 
 # Module design configuration with zeus context
 _design = load_env_design + design(
@@ -1,33 +1,15 @@
 """Test to verify embedded components functionality works correctly"""
 
 import pytest
-from pathlib import Path
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
 from loguru import logger
+from test._common_design import SHARED_RESOLVER, SHORT_NAME_RESOLVER
 
-# Create storage resolver for test projects
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
-REPO_ROOT = Path(__file__).parent.parent
-
-test_storage_resolver = StaticStorageResolver(
-    {
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-        "test_rye": TEST_PROJECT_ROOT / "test_rye",
-        "test_setuppy": TEST_PROJECT_ROOT / "test_setuppy",
-        "test_requirements": TEST_PROJECT_ROOT / "test_requirements",
-        "test_source": TEST_PROJECT_ROOT / "test_source",
-        "test_resource": TEST_PROJECT_ROOT / "test_resource",
-        # For embedded tests
-        "test/dummy_projects/test_uv": TEST_PROJECT_ROOT / "test_uv",
-        "test/dummy_projects/test_requirements": TEST_PROJECT_ROOT
-        / "test_requirements",
-        "test/dummy_projects/test_setuppy": TEST_PROJECT_ROOT / "test_setuppy",
-    }
-)
+# Bare "<name>" ids plus the "test/dummy_projects/<name>" ids of the embedded tests
+test_storage_resolver = SHORT_NAME_RESOLVER + SHARED_RESOLVER
 
 # Test design configuration with real docker host
 test_design = load_env_design + design(
@@ -130,7 +112,7 @@ async def test_embedded_dockerfile_generation(schematics_universal, logger):
     assert len(builder.macros) > 0
     
     # Check for UV in scripts (which is used for embedded projects)
-    assert "uv" in scripts_str.lower() or "UV" in scripts_str
+    assert "uv" in scripts_str.lower()
     
     # Check that it's setting up a UV environment (for auto-embed)
     assert "UV_PROJECT_ENVIRONMENT" in scripts_str or "uv" in scripts_str.lower()
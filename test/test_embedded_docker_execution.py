@@ -9,6 +9,9 @@ from ml_nexus.storage_resolver import StaticStorageResolver
 from loguru import logger
 import pytest
 
+# Every test here runs containers on zeus; conftest.py skips them when it is unreachable
+pytestmark = pytest.mark.zeus
+
 # Create storage resolver for test projects
 TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
 
@@ -1,23 +1,14 @@
 """Test embedded components by actually running Python scripts in Docker containers"""
 
-from pathlib import Path
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
 from loguru import logger
+from test._common_design import SHORT_NAME_RESOLVER
 
-# Create storage resolver for test projects
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
-
-_storage_resolver = StaticStorageResolver(
-    {
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-        "test_requirements": TEST_PROJECT_ROOT / "test_requirements",
-        "test_setuppy": TEST_PROJECT_ROOT / "test_setuppy",
-    }
-)
+# Storage resolver for the dummy test projects, shared with other modules
+_storage_resolver = SHORT_NAME_RESOLVER
 
 # Test design configuration
 _design = load_env_design + design(
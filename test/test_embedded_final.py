@@ -1,22 +1,15 @@
 """Test embedded components using @injected_pytest"""
 
-from pathlib import Path
+import pytest
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
 from loguru import logger
+from test._common_design import SHORT_NAME_RESOLVER
 
-# Create storage resolver for test projects
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
-
-_storage_resolver = StaticStorageResolver(
-    {
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-        "test_requirements": TEST_PROJECT_ROOT / "test_requirements",
-    }
-)
+# Storage resolver for the dummy test projects, shared with other modules
+_storage_resolver = SHORT_NAME_RESOLVER
 
 # Test design - use zeus for Docker host and context
 _design = load_env_design + design(
@@ -45,6 +38,7 @@ async def test_uv_auto_embed_schematic(schematics_universal, logger):
 
 
 # Test 2: UV auto-embed Docker environment and execution
+@pytest.mark.zeus
 @injected_pytest(_design)
 async def test_uv_auto_embed_docker_run(
     schematics_universal,
@@ -108,6 +102,7 @@ async def test_pyvenv_embed_schematic(schematics_universal, logger):
 
 
 # Test 4: Pyvenv-embed Docker environment and execution
+@pytest.mark.zeus
 @injected_pytest(_design)
 async def test_pyvenv_embed_docker_run(
     schematics_universal,
@@ -1,34 +1,15 @@
 """Test to verify Python execution works in embedded pyvenv containers"""
 
-from pathlib import Path
-from pinjected import design
+import pytest
 from pinjected.test import injected_pytest
-from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
-from loguru import logger
+from test._common_design import COMMON_DESIGN
 
-# Configure static resolver for test directories
-_storage_resolver = StaticStorageResolver(
-    {
-        "test/dummy_projects/test_requirements": Path(__file__).parent
-        / "dummy_projects"
-        / "test_requirements",
-        "test/dummy_projects/test_uv": Path(__file__).parent
-        / "dummy_projects"
-        / "test_uv",
-        "test/dummy_projects/test_setuppy": Path(__file__).parent
-        / "dummy_projects"
-        / "test_setuppy",
-    }
-)
+# Every test here runs containers on zeus; conftest.py skips them when it is unreachable
+pytestmark = pytest.mark.zeus
 
 # Test design configuration
-_design = load_env_design + design(
-    ml_nexus_docker_build_context="zeus",
-    storage_resolver=_storage_resolver,
-    logger=logger
-)
+_design = COMMON_DESIGN
 
 
 # Test: Python execution in pyvenv-embed container
@@ -74,8 +55,8 @@ python --version
 echo -e "\n2. Checking which Python:"
 which python
 
-echo -e "\n3. Checking pip list:"
-pip list
+echo -e "\n3. Checking installed distributions:"
+python -c "import importlib.metadata as m; print('\\n'.join(f'{d.name}=={d.version}' for d in m.distributions()))"
 
 echo -e "\n4. Testing Python import and execution:"
 python -c "
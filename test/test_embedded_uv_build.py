@@ -1,27 +1,16 @@
 """Test UV embedded Docker image with Python execution"""
 
-from pathlib import Path
-from pinjected import design
+import pytest
 from pinjected.test import injected_pytest
 
-from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
+from test._common_design import COMMON_DESIGN
 
-# Configure static resolver for test directories
-_storage_resolver = StaticStorageResolver(
-    {
-        "test/dummy_projects/test_uv": Path(__file__).parent
-        / "dummy_projects"
-        / "test_uv",
-    }
-)
+# Every test here runs containers on zeus; conftest.py skips them when it is unreachable
+pytestmark = pytest.mark.zeus
 
 # Test design configuration
-_design = load_env_design + design(
-    ml_nexus_docker_build_context="zeus",
-    storage_resolver=_storage_resolver,
-)
+_design = COMMON_DESIGN
 
 
 @injected_pytest(_design)
@@ -1,10 +1,12 @@
 from pathlib import Path
 
+import pytest
 from pinjected import design
 from pinjected.test import injected_pytest
 
 from ml_nexus.storage_resolver import StaticStorageResolver
 from ml_nexus.project_structure import ProjectDef, ProjectDir
+from test.container_pool import container_pool, session_container_name
 
 # Setup test paths
 _dir = Path(__file__).parent / "dummy_projects"
@@ -20,6 +22,32 @@ _project = ProjectDef(
     dirs=[ProjectDir(id="test/dummy_projects/test_requirements", kind="uv-pip-embed")]
 )
 
+# Probe script, kept ASCII-only and pre-encoded once at import
+_PROBE_SCRIPT = b"""
+echo "=== Testing uv-pip-embed with requirements.txt ==="
+echo ""
+echo "1. Python version:"
+python --version
+echo ""
+echo "2. UV version:"
+uv --version
+echo ""
+echo "3. Which python:"
+which python
+echo ""
+echo "4. Installed packages:"
+python -c "import importlib.metadata as m; [print(f'{p}: {m.version(p)}') for p in ('requests', 'numpy')]"
+echo ""
+echo "5. Test imports:"
+python -c "
+import requests
+import numpy as np
+print(f'[OK] requests {requests.__version__}')
+print(f'[OK] numpy {np.__version__}')
+print('[OK] All imports successful!')
+"
+"""
+
 # Create test design with all dependencies
 _design = design(
     storage_resolver=_storage_resolver,
@@ -31,6 +59,7 @@ def test_something(logger):
     logger.info("Test something is running")
     assert True
 
+@pytest.mark.zeus
 @injected_pytest(_design)
 async def test_requirements_run(
     a_PersistentDockerEnvFromSchematics,
@@ -50,41 +79,17 @@ async def test_requirements_run(
         project=_project,
         schematics=schematics,
         docker_host="zeus",
-        container_name="test_uv_pip_embed_requirements",
+        container_name=session_container_name("test_injected_pytest_requirements"),
     )
     
-    await docker_env.start()
+    # Started once per session and shared with later tests using the same name
+    await container_pool.acquire(docker_env)
     
     try:
         # Run the test script
-        await docker_env.run_script("""
-echo "=== Testing uv-pip-embed with requirements.txt ==="
-echo ""
-echo "1. Python version:"
-python --version
-echo ""
-echo "2. UV version:"
-uv --version
-echo ""
-echo "3. Which python:"
-which python
-echo ""
-echo "4. Installed packages:"
-pip list | grep -E "(requests|numpy)"
-echo ""
-echo "5. Test imports:"
-python -c "
-import requests
-import numpy as np
-print(f'✅ requests {requests.__version__}')
-print(f'✅ numpy {np.__version__}')
-print('✅ All imports successful!')
-"        """)
+        await docker_env.run_script_bytes(_PROBE_SCRIPT)
         
         logger.info("Test completed successfully")
     finally:
-        # Clean up after test
-        try:
-            await docker_env.stop()
-        except Exception as e:
-            logger.warning(f"Failed to stop container: {e}")
\ No newline at end of file
+        # The pool stops the container at the end of the session
+        await container_pool.release(docker_env)
\ No newline at end of file
@@ -8,34 +8,45 @@ This test suite verifies all functionality of PersistentDockerEnvFromSchematics
 - Error handling and edge cases
 """
 
+import asyncio
+from dataclasses import replace
+import itertools
 from pathlib import Path
 import tempfile
-import uuid
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.docker.builder.docker_env_with_schematics import DockerHostPlacement
 from ml_nexus.event_bus_util import handle_ml_nexus_system_call_events__simple
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
+from ml_nexus.schematics import ContainerSchematic
 from loguru import logger
 import pytest
+from test._common_design import (
+    SESSION_BUILD_CACHE,
+    SHORT_NAME_RESOLVER,
+    TEST_DOCKER_CACHE_FROM,
+)
+from test.container_pool import container_pool, session_container_name
+
+# Every test here runs containers on zeus; conftest.py skips them when it is unreachable
+pytestmark = pytest.mark.zeus
 
 # Setup test project paths
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
 REPO_ROOT = Path(__file__).parent.parent
 
+# Containers private to one test get a counter on top of the session name,
+# so two tests (or a retry) never share one; pooled containers use the bare
+# session_container_name() so every test reaches the same one.
+_counter = itertools.count()
+
+
+def _container_name(prefix: str) -> str:
+    return f"{session_container_name(prefix)}_{next(_counter)}"
+
+
 # Test storage resolver
-test_storage_resolver = StaticStorageResolver(
-    {
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-        "test_rye": TEST_PROJECT_ROOT / "test_rye",
-        "test_setuppy": TEST_PROJECT_ROOT / "test_setuppy",
-        "test_requirements": TEST_PROJECT_ROOT / "test_requirements",
-        "test_source": TEST_PROJECT_ROOT / "test_source",
-        "test_resource": TEST_PROJECT_ROOT / "test_resource",
-    }
-)
+test_storage_resolver = SHORT_NAME_RESOLVER
 
 # Test design configuration
 test_design = design(
@@ -49,9 +60,126 @@ test_design = design(
     ),
     docker_host="zeus",
     ml_nexus_docker_build_context="zeus",  # Ensure Docker context is set
+    # one build per distinct schematic for the whole session, not per test
+    docker_build_digest_cache=SESSION_BUILD_CACHE,
+    ml_nexus_docker_cache_from=TEST_DOCKER_CACHE_FROM,
 )
 
 
+# Projects used by the tests below, built once at import
+_PROJECTS = {
+    "source": ProjectDef(dirs=[ProjectDir("test_source", kind="source")]),
+    "uv": ProjectDef(dirs=[ProjectDir("test_uv", kind="uv")]),
+    "complex": ProjectDef(
+        dirs=[
+            ProjectDir("test_uv", kind="uv"),
+            ProjectDir("test_resource", kind="resource"),
+            ProjectDir("test_source", kind="source"),
+        ]
+    ),
+}
+
+_SCHEMATIC_CACHE: dict[tuple[str, str], ContainerSchematic] = {}
+
+# Every (project, base_image) combination the tests below ask for
+_ALL_COMBOS = [
+    ("source", "ubuntu:22.04"),
+    ("uv", "python:3.11-slim"),
+    ("complex", "python:3.11-slim"),
+]
+
+
+async def _warm_schematic_cache(schematics_universal, key: tuple[str, str]):
+    """Compute every missing schematic of this module concurrently.
+
+    Only successes are cached. A failure is raised only for the requested key,
+    so one broken combination fails its own tests rather than whichever warms first.
+    """
+    missing = [
+        k for k in dict.fromkeys([*_ALL_COMBOS, key]) if k not in _SCHEMATIC_CACHE
+    ]
+    results = await asyncio.gather(
+        *[
+            schematics_universal(target=_PROJECTS[project_key], base_image=base_image)
+            for project_key, base_image in missing
+        ],
+        return_exceptions=True,
+    )
+    for k, result in zip(missing, results):
+        if isinstance(result, BaseException):
+            if k == key:
+                raise result
+        else:
+            _SCHEMATIC_CACHE[k] = result
+
+
+async def _cached_schematic(
+    schematics_universal, project_key: str, base_image: str
+) -> ContainerSchematic:
+    """schematics_universal, memoized per (project, base_image) for this module.
+
+    The first miss warms all of _ALL_COMBOS at once, so later tests hit the cache.
+    The builder is re-instantiated on every hit so its build lock and event
+    belong to the calling test's event loop rather than the first one.
+    """
+    key = (project_key, base_image)
+    if key not in _SCHEMATIC_CACHE:
+        await _warm_schematic_cache(schematics_universal, key)
+    schematic = _SCHEMATIC_CACHE[key]
+    return replace(schematic, builder=replace(schematic.builder))
+
+
+# Read-only tests that only need a running ubuntu:22.04 "source" container
+# share this one. The first test to acquire it from the pool pays the startup,
+# later tests reuse it, and the pool stops it at the end of the session.
+# Tests that write files or run mutating scripts use _private_ubuntu_env.
+_SHARED_UBUNTU_CONTAINER = session_container_name("test_shared_ubuntu")
+
+
+async def _shared_ubuntu_env(
+    schematics_universal, new_PersistentDockerEnvFromSchematics
+):
+    schematic = await _cached_schematic(schematics_universal, "source", "ubuntu:22.04")
+    docker_env = new_PersistentDockerEnvFromSchematics(
+        project=_PROJECTS["source"],
+        schematics=schematic,
+        docker_host="zeus",
+        container_name=_SHARED_UBUNTU_CONTAINER,
+    )
+    return await container_pool.acquire(docker_env)
+
+
+def _private_ubuntu_env(
+    schematic, new_PersistentDockerEnvFromSchematics, prefix: str
+):
+    """A "source" container of this test's own; the caller stops it."""
+    return new_PersistentDockerEnvFromSchematics(
+        project=_PROJECTS["source"],
+        schematics=schematic,
+        docker_host="zeus",
+        container_name=_container_name(prefix),
+    )
+
+
+async def _run_batch(docker_env, cmds: list[str]) -> list[tuple[int, str]]:
+    """Run independent commands in a single docker exec.
+
+    Returns (exit_code, output) per command. The script runs with `set +e`,
+    so one failing command does not stop the rest; callers check the codes.
+    """
+    script = "set +e\n" + "\n".join(
+        f'echo "===SEP_{i}==="\n{cmd}\necho "===RC_{i}=$?"'
+        for i, cmd in enumerate(cmds)
+    )
+    result = await docker_env.run_script(script + "\ntrue")
+    sections = []
+    for i in range(len(cmds)):
+        body = result.stdout.split(f"===SEP_{i}===", 1)[1]
+        output, rc = body.split(f"===RC_{i}=", 1)
+        sections.append((int(rc.split()[0]), output.strip()))
+    return sections
+
+
 # ===== Test 1: Basic container lifecycle =====
 @injected_pytest(test_design)
 async def test_persistent_container_lifecycle(
@@ -61,13 +189,13 @@ async def test_persistent_container_lifecycle(
     logger.info("Testing persistent container lifecycle")
 
     # Create a simple project
-    project = ProjectDef(dirs=[ProjectDir("test_source", kind="source")])
+    project = _PROJECTS["source"]
 
     # Generate schematic
-    schematic = await schematics_universal(target=project, base_image="ubuntu:22.04")
+    schematic = await _cached_schematic(schematics_universal, "source", "ubuntu:22.04")
 
     # Create unique container name
-    container_name = f"test_persistent_lifecycle_{uuid.uuid4().hex[:8]}"
+    container_name = _container_name("test_persistent_lifecycle")
 
     # Create persistent Docker environment
     docker_env = new_PersistentDockerEnvFromSchematics(
@@ -84,8 +212,10 @@ async def test_persistent_container_lifecycle(
         logger.info("✓ Container correctly not ready initially")
 
         # Run a script - this should create and start the container
-        result = await docker_env.run_script("echo 'Container started'")
-        assert "Container started" in result.stdout
+        # returns as soon as the line shows up (raises if it never does)
+        result = await docker_env.run_script(
+            "echo 'Container started'", expect="Container started"
+        )
         assert result.exit_code == 0
         logger.info("✓ Container started successfully")
 
@@ -102,7 +232,7 @@ async def test_persistent_container_lifecycle(
     finally:
         # Clean up - stop the container if it exists
         try:
-            await docker_env.stop()
+            await docker_env.stop(timeout=0)
             logger.info("✓ Container stopped")
         except Exception as e:
             logger.info(f"Container stop skipped: {e}")
@@ -118,13 +248,11 @@ async def test_container_persistence_across_instances(
     """Test that containers persist across different instances with same name"""
     logger.info("Testing container persistence across instances")
 
-    project = ProjectDef(dirs=[ProjectDir("test_uv", kind="uv")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
-    )
+    project = _PROJECTS["uv"]
+    schematic = await _cached_schematic(schematics_universal, "uv", "python:3.11-slim")
 
     # Use a fixed container name
-    container_name = f"test_persistence_{uuid.uuid4().hex[:8]}"
+    container_name = _container_name("test_persistence")
 
     # Create first instance
     docker_env1 = new_PersistentDockerEnvFromSchematics(
@@ -163,7 +291,7 @@ async def test_container_persistence_across_instances(
 
     finally:
         # Clean up
-        await docker_env1.stop()
+        await docker_env1.stop(timeout=0)
 
     logger.info("✅ Container persistence test passed")
 
@@ -176,26 +304,20 @@ async def test_file_operations(
     """Test upload, download, and sync operations"""
     logger.info("Testing file operations")
 
-    project = ProjectDef(dirs=[ProjectDir("test_source", kind="source")])
-    schematic = await schematics_universal(target=project, base_image="ubuntu:22.04")
-
-    container_name = f"test_file_ops_{uuid.uuid4().hex[:8]}"
-    docker_env = new_PersistentDockerEnvFromSchematics(
-        project=project,
-        schematics=schematic,
-        docker_host="zeus",
-        container_name=container_name,
+    schematic = await _cached_schematic(schematics_universal, "source", "ubuntu:22.04")
+    docker_env = _private_ubuntu_env(
+        schematic, new_PersistentDockerEnvFromSchematics, "test_file_ops"
     )
 
     try:
         # Create a temporary file to upload
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            f.write("Test upload content\n")
-            local_upload_path = Path(f.name)
+        with tempfile.TemporaryDirectory() as upload_dir:
+            local_upload_path = Path(upload_dir) / "upload.txt"
+            local_upload_path.write_text("Test upload content\n")
 
-        # Test upload
-        remote_path = Path("/tmp/uploaded_file.txt")
-        await docker_env.upload(local_upload_path, remote_path)
+            # Test upload
+            remote_path = Path("/tmp/uploaded_file.txt")
+            await docker_env.upload(local_upload_path, remote_path)
         logger.info("✓ File uploaded")
 
         # Verify upload
@@ -234,16 +356,16 @@ async def test_file_operations(
             await docker_env.sync_to_container(sync_dir, remote_sync_path)
             logger.info("✓ Sync to container completed")
 
-            # Verify sync
-            result = await docker_env.run_script(f"ls {remote_sync_path}")
+            # Verify sync and modify a file in container; neither depends on the other
+            result, _ = await asyncio.gather(
+                docker_env.run_script(f"ls {remote_sync_path}"),
+                docker_env.run_script(
+                    f"echo 'Modified in container' > {remote_sync_path}/file3.txt"
+                ),
+            )
             assert "file1.txt" in result.stdout
             assert "file2.txt" in result.stdout
 
-            # Modify a file in container
-            await docker_env.run_script(
-                f"echo 'Modified in container' > {remote_sync_path}/file3.txt"
-            )
-
             # Sync back from container
             sync_back_dir = Path(tmpdir) / "sync_back"
             await docker_env.sync_from_container(remote_sync_path, sync_back_dir)
@@ -256,10 +378,23 @@ async def test_file_operations(
             assert "Modified in container" in (sync_back_dir / "file3.txt").read_text()
             logger.info("✓ Sync back verified")
 
+            # Batch sync: several entries through a single tar stream
+            await docker_env.sync_to_container_batch(
+                [
+                    (sync_dir / "file1.txt", Path("/tmp/batch_sync/a.txt")),
+                    (sync_dir / "file2.txt", Path("/tmp/batch_sync/b.txt")),
+                ]
+            )
+            result = await docker_env.run_script(
+                "cat /tmp/batch_sync/a.txt /tmp/batch_sync/b.txt"
+            )
+            assert "File 1 content" in result.stdout
+            assert "File 2 content" in result.stdout
+            logger.info("✓ Batch sync verified")
+
     finally:
         # Clean up
-        await docker_env.stop()
-        local_upload_path.unlink(missing_ok=True)
+        await docker_env.stop(timeout=0)
 
     logger.info("✅ File operations test passed")
 
@@ -267,22 +402,13 @@ async def test_file_operations(
 # ===== Test 4: Docker context support =====
 @injected_pytest(test_design)
 async def test_docker_context_support(
-    schematics_universal, new_PersistentDockerEnvFromSchematics, a_docker_ps, logger
+    schematics_universal, new_PersistentDockerEnvFromSchematics, logger
 ):
     """Test that Docker context is properly used in all operations"""
     logger.info("Testing Docker context support")
 
-    project = ProjectDef(dirs=[ProjectDir("test_source", kind="source")])
-    schematic = await schematics_universal(target=project, base_image="ubuntu:22.04")
-
-    container_name = f"test_context_{uuid.uuid4().hex[:8]}"
-
-    # Create persistent Docker environment with context
-    docker_env = new_PersistentDockerEnvFromSchematics(
-        project=project,
-        schematics=schematic,
-        docker_host="zeus",
-        container_name=container_name,
+    docker_env = await _shared_ubuntu_env(
+        schematics_universal, new_PersistentDockerEnvFromSchematics
     )
 
     try:
@@ -295,19 +421,18 @@ async def test_docker_context_support(
         assert result.exit_code == 0
         logger.info("✓ Container started with context")
 
-        # Use a_docker_ps to verify container is visible with context
-        df = await a_docker_ps(docker_host="zeus")
-        assert container_name in df.index, (
-            f"Container {container_name} not found in docker ps"
+        # Verify the container is visible through the same context
+        assert await docker_env.a_container_exists(), (
+            f"Container {docker_env.container_name} not found via docker inspect"
         )
-        logger.info("✓ Container visible through docker ps with context")
+        logger.info("✓ Container visible through docker inspect with context")
 
         # Test that all docker commands use the context
         # This is implicitly tested by the operations working correctly with zeus context
 
     finally:
         # Clean up
-        await docker_env.stop()
+        await container_pool.release(docker_env)
 
     logger.info("✅ Docker context support test passed")
 
@@ -320,15 +445,9 @@ async def test_error_handling(
     """Test error handling in various scenarios"""
     logger.info("Testing error handling")
 
-    project = ProjectDef(dirs=[ProjectDir("test_source", kind="source")])
-    schematic = await schematics_universal(target=project, base_image="ubuntu:22.04")
-
-    container_name = f"test_errors_{uuid.uuid4().hex[:8]}"
-    docker_env = new_PersistentDockerEnvFromSchematics(
-        project=project,
-        schematics=schematic,
-        docker_host="zeus",
-        container_name=container_name,
+    schematic = await _cached_schematic(schematics_universal, "source", "ubuntu:22.04")
+    docker_env = _private_ubuntu_env(
+        schematic, new_PersistentDockerEnvFromSchematics, "test_errors"
     )
 
     try:
@@ -357,7 +476,7 @@ async def test_error_handling(
 
     finally:
         # Clean up
-        await docker_env.stop()
+        await docker_env.stop(timeout=0)
 
     logger.info("✅ Error handling test passed")
 
@@ -371,19 +490,13 @@ async def test_complex_project_types(
     logger.info("Testing complex project types")
 
     # Create a complex project with multiple directories
-    project = ProjectDef(
-        dirs=[
-            ProjectDir("test_uv", kind="uv"),
-            ProjectDir("test_resource", kind="resource"),
-            ProjectDir("test_source", kind="source"),
-        ]
-    )
+    project = _PROJECTS["complex"]
 
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
+    schematic = await _cached_schematic(
+        schematics_universal, "complex", "python:3.11-slim"
     )
 
-    container_name = f"test_complex_{uuid.uuid4().hex[:8]}"
+    container_name = _container_name("test_complex")
     docker_env = new_PersistentDockerEnvFromSchematics(
         project=project,
         schematics=schematic,
@@ -392,27 +505,35 @@ async def test_complex_project_types(
     )
 
     try:
+        # The checks are independent, so run them in one docker exec round-trip
+        cmds = [
+            "which uv || echo 'UV not found'",
+            "python --version",
+            "ls /resources/",
+            "ls /source/",
+        ]
+        outs = await _run_batch(docker_env, cmds)
+        for cmd, (code, output) in zip(cmds, outs):
+            assert code == 0, f"{cmd!r} failed with exit code {code}: {output}"
+        uv_out, py_out, res_out, src_out = [output for _, output in outs]
+
         # Test UV is available
-        result = await docker_env.run_script("which uv || echo 'UV not found'")
-        assert "uv" in result.stdout and "not found" not in result.stdout
+        assert "uv" in uv_out and "not found" not in uv_out
         logger.info("✓ UV is available")
 
         # Test Python is available
-        result = await docker_env.run_script("python --version")
-        assert "Python" in result.stdout
+        assert "Python" in py_out
         logger.info("✓ Python is available")
 
         # Test resources are mounted
-        result = await docker_env.run_script("ls /resources/")
-        logger.info(f"Resources available: {result.stdout}")
+        logger.info(f"Resources available: {res_out}")
 
         # Test project source is available
-        result = await docker_env.run_script("ls /source/")
-        logger.info(f"Source available: {result.stdout}")
+        logger.info(f"Source available: {src_out}")
 
     finally:
         # Clean up
-        await docker_env.stop()
+        await docker_env.stop(timeout=0)
 
     logger.info("✅ Complex project types test passed")
 
@@ -425,10 +546,10 @@ async def test_container_state_verification(
     """Test container state verification and wait functionality"""
     logger.info("Testing container state verification")
 
-    project = ProjectDef(dirs=[ProjectDir("test_source", kind="source")])
-    schematic = await schematics_universal(target=project, base_image="ubuntu:22.04")
+    project = _PROJECTS["source"]
+    schematic = await _cached_schematic(schematics_universal, "source", "ubuntu:22.04")
 
-    container_name = f"test_state_{uuid.uuid4().hex[:8]}"
+    container_name = _container_name("test_state")
     docker_env = new_PersistentDockerEnvFromSchematics(
         project=project,
         schematics=schematic,
@@ -460,7 +581,7 @@ async def test_container_state_verification(
 
     finally:
         # Clean up
-        await docker_env.stop()
+        await docker_env.stop(timeout=0)
 
         # Verify container is no longer running
         is_ready = await docker_env.a_is_container_ready()
@@ -478,16 +599,11 @@ async def test_random_remote_path(
     """Test random remote path generation"""
     logger.info("Testing random remote path generation")
 
-    project = ProjectDef(dirs=[ProjectDir("test_source", kind="source")])
-    schematic = await schematics_universal(target=project, base_image="ubuntu:22.04")
-
-    container_name = f"test_random_path_{uuid.uuid4().hex[:8]}"
-    docker_env = new_PersistentDockerEnvFromSchematics(
-        project=project,
-        schematics=schematic,
-        docker_host="zeus",
-        container_name=container_name,
+    schematic = await _cached_schematic(schematics_universal, "source", "ubuntu:22.04")
+    docker_env = _private_ubuntu_env(
+        schematic, new_PersistentDockerEnvFromSchematics, "test_random_path"
     )
+    project = docker_env.project
 
     try:
         # Generate random paths
@@ -504,20 +620,16 @@ async def test_random_remote_path(
         logger.info("✓ Paths follow expected pattern")
 
         # Test using random path for upload
-        with tempfile.NamedTemporaryFile(mode="w") as f:
-            f.write("Random path test")
-            f.flush()
-
-            random_path = docker_env.random_remote_path()
-            await docker_env.upload(Path(f.name), random_path)
+        random_path = docker_env.random_remote_path()
+        await docker_env.upload_bytes(b"Random path test", random_path)
 
-            result = await docker_env.run_script(f"cat {random_path}")
-            assert "Random path test" in result.stdout
-            logger.info("✓ Random path usable for operations")
+        result = await docker_env.run_script(f"cat {random_path}")
+        assert "Random path test" in result.stdout
+        logger.info("✓ Random path usable for operations")
 
     finally:
         # Clean up
-        await docker_env.stop()
+        await docker_env.stop(timeout=0)
 
     logger.info("✅ Random remote path test passed")
 
@@ -530,15 +642,8 @@ async def test_run_context(
     """Test ScriptRunContext functionality"""
     logger.info("Testing ScriptRunContext")
 
-    project = ProjectDef(dirs=[ProjectDir("test_source", kind="source")])
-    schematic = await schematics_universal(target=project, base_image="ubuntu:22.04")
-
-    container_name = f"test_context_{uuid.uuid4().hex[:8]}"
-    docker_env = new_PersistentDockerEnvFromSchematics(
-        project=project,
-        schematics=schematic,
-        docker_host="zeus",
-        container_name=container_name,
+    docker_env = await _shared_ubuntu_env(
+        schematics_universal, new_PersistentDockerEnvFromSchematics
     )
 
     try:
@@ -565,7 +670,7 @@ async def test_run_context(
 
     finally:
         # Clean up
-        await docker_env.stop()
+        await container_pool.release(docker_env)
 
     logger.info("✅ Run context test passed")
 
@@ -579,12 +684,10 @@ async def test_python_execution_uv(
     logger.info("Testing Python execution in persistent container with UV project")
 
     # Create a UV project for Python environment
-    project = ProjectDef(dirs=[ProjectDir("test_uv", kind="uv")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
-    )
+    project = _PROJECTS["uv"]
+    schematic = await _cached_schematic(schematics_universal, "uv", "python:3.11-slim")
 
-    container_name = f"test_python_exec_uv_{uuid.uuid4().hex[:8]}"
+    container_name = _container_name("test_python_exec_uv")
     docker_env = new_PersistentDockerEnvFromSchematics(
         project=project,
         schematics=schematic,
@@ -669,7 +772,7 @@ PYTHON_EOF
 
     finally:
         # Clean up
-        await docker_env.stop()
+        await docker_env.stop(timeout=0)
 
     logger.info("✅ Python execution with UV test passed")
 
@@ -692,7 +795,7 @@ async def test_python_execution_requirements_auto(
         python_version="3.11",
     )
 
-    container_name = f"test_python_exec_req_{uuid.uuid4().hex[:8]}"
+    container_name = _container_name("test_python_exec_req")
     docker_env = new_PersistentDockerEnvFromSchematics(
         project=project,
         schematics=schematic,
@@ -778,7 +881,7 @@ print("All imports successful!")
 
     finally:
         # Clean up
-        await docker_env.stop()
+        await docker_env.stop(timeout=0)
 
     logger.info("✅ Python execution with requirements.txt (auto) test passed")
 
@@ -796,7 +899,6 @@ __design__ = (
 # ===== Main test runner =====
 if __name__ == "__main__":
     # This allows running the tests directly with: python test_persistent_docker_env_from_schematics.py
-    import asyncio
 
     async def run_all_tests():
         """Run all tests manually"""
@@ -1,41 +1,48 @@
 """Test that all ProjectKind values are properly supported throughout the codebase"""
 
 import pytest
-from pathlib import Path
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir, ProjectKind
-from ml_nexus.storage_resolver import StaticStorageResolver
 from loguru import logger
+from test._common_design import SHORT_NAME_RESOLVER
 from typing import get_args
 
-# Create storage resolver for test projects
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
-
-test_storage_resolver = StaticStorageResolver(
-    {
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-        "test_rye": TEST_PROJECT_ROOT / "test_rye",
-        "test_setuppy": TEST_PROJECT_ROOT / "test_setuppy",
-        "test_requirements": TEST_PROJECT_ROOT / "test_requirements",
-        "test_source": TEST_PROJECT_ROOT / "test_source",
-        "test_resource": TEST_PROJECT_ROOT / "test_resource",
-    }
-)
+# Storage resolver for the dummy test projects, shared with other modules
+test_storage_resolver = SHORT_NAME_RESOLVER
 
 # Test design configuration
 test_design = load_env_design + design(
     storage_resolver=test_storage_resolver, logger=logger
 )
 
+# All possible values from the ProjectKind Literal type
+_ALL_KINDS = get_args(ProjectKind)
+
+# Test project used for each kind; any other kind falls back to test_source
+_KIND_TO_TEST_ID: dict[str, str] = {
+    "uv": "test_uv",
+    "auto": "test_uv",
+    "auto-embed": "test_uv",
+    "rye": "test_rye",
+    "setup.py": "test_setuppy",
+    "pyvenv-embed": "test_setuppy",
+    "uv-pip-embed": "test_setuppy",
+    "requirement.txt": "test_requirements",
+    # pyvenv can work with either setup.py or requirements.txt
+    # Use test_setuppy as it has setup.py
+    "pyvenv": "test_setuppy",
+    "resource": "test_resource",
+    "source": "test_source",
+}
+
 
 @injected_pytest(test_design)
 async def test_all_project_kinds_are_handled(a_prepare_setup_script_with_deps, logger):
     """Test that all values in ProjectKind type alias are handled in a_prepare_setup_script_with_deps"""
 
-    # Get all possible values from the ProjectKind Literal type
-    all_kinds = get_args(ProjectKind)
+    all_kinds = _ALL_KINDS
 
     logger.info(f"Testing all {len(all_kinds)} project kinds: {all_kinds}")
 
@@ -45,25 +52,7 @@ async def test_all_project_kinds_are_handled(a_prepare_setup_script_with_deps, l
 
         # Create a project definition with the specific kind
         # Use appropriate test project based on kind
-        if kind in ["uv", "auto", "auto-embed"]:
-            test_id = "test_uv"
-        elif kind == "rye":
-            test_id = "test_rye"
-        elif kind in ["setup.py", "pyvenv-embed", "uv-pip-embed"]:
-            test_id = "test_setuppy"
-        elif kind == "requirement.txt":
-            test_id = "test_requirements"
-        elif kind == "pyvenv":
-            # pyvenv can work with either setup.py or requirements.txt
-            # Use test_setuppy as it has setup.py
-            test_id = "test_setuppy"
-        elif kind == "resource":
-            test_id = "test_resource"
-        elif kind == "source":
-            test_id = "test_source"
-        else:
-            # For any other kind, use a generic test project
-            test_id = "test_source"
+        test_id = _KIND_TO_TEST_ID.get(kind, "test_source")
 
         project = ProjectDef(dirs=[ProjectDir(id=test_id, kind=kind)])
 
@@ -4,193 +4,186 @@ This test suite builds Docker images from the schematics and runs Python
 commands inside the containers to verify the environments are properly set up.
 """
 
-from pathlib import Path
+import os
+
+import pytest
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
+from ml_nexus.util import CommandException
 from loguru import logger
-
-# Setup test project resolver
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
-
-test_storage_resolver = StaticStorageResolver(
-    {
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-        "test_rye": TEST_PROJECT_ROOT / "test_rye",
-        "test_setuppy": TEST_PROJECT_ROOT / "test_setuppy",
-        "test_requirements": TEST_PROJECT_ROOT / "test_requirements",
-        "test_source": TEST_PROJECT_ROOT / "test_source",
-    }
+from test._common_design import (
+    SESSION_BUILD_CACHE,
+    SHORT_NAME_RESOLVER,
+    TEST_DOCKER_CACHE_FROM,
 )
 
+# Docker host the images are built and the containers run on; a docker context
+# of the same name is expected. conftest.py probes it once per session and
+# skips this module up front when it is unreachable.
+_DOCKER_HOST = os.environ.get("ML_NEXUS_TEST_DOCKER_HOST", "zeus")
+
+pytestmark = pytest.mark.zeus(_DOCKER_HOST)
+
+# Storage resolver for the dummy test projects, shared with other modules
+test_storage_resolver = SHORT_NAME_RESOLVER
+
 # Test design configuration
 test_design = load_env_design + design(
     storage_resolver=test_storage_resolver,
     logger=logger,
-    docker_host="zeus",  # Required Docker host for this repo
-    ml_nexus_docker_build_context="zeus",  # Use zeus Docker context for builds
+    docker_host=_DOCKER_HOST,
+    ml_nexus_docker_build_context=_DOCKER_HOST,  # build where the containers run
+    # images with an unchanged build context are re-tagged across the session
+    docker_build_digest_cache=SESSION_BUILD_CACHE,
+    ml_nexus_docker_cache_from=TEST_DOCKER_CACHE_FROM,
 )
 
+# Separates the outputs of probes fused into one run_script call
+_PROBE_SEP = "===PROBE==="
+
+
+def _python_probe(*snippets: str) -> str:
+    """Run the Python snippets in one `python -` heredoc, i.e. one docker run and
+    one interpreter start, printing _PROBE_SEP between their outputs."""
+    body = f"\nprint({_PROBE_SEP!r})\n".join(snippets)
+    return f"python - <<'PY'\n{body}\nPY"
+
+
+def _probe_outputs(stdout: str, n: int) -> list[str]:
+    """Split the stdout of a _python_probe run back into one section per snippet."""
+    sections = stdout.split(_PROBE_SEP)
+    assert len(sections) == n, f"Expected {n} probe sections, got: {stdout}"
+    return sections
+
+
 # Module design configuration
 # __meta_design__ = design(overrides=load_env_design + test_design)  # Removed deprecated __meta_design__
 
+_VERSION_PROBE = (
+    "import platform; print(f'Python {platform.python_version()}')",
+    ("Python",),
+)
 
-# ===== Test UV Project Docker Run =====
-@injected_pytest(test_design)
-async def test_uv_docker_python(
-    schematics_universal, new_DockerEnvFromSchematics, logger
+# test name -> (project id, kind, probes). Each probe is a Python snippet and
+# the substrings its output must contain; all probes of a case share one
+# interpreter (see _python_probe).
+_PYTHON_CASES = {
+    "uv": (
+        "test_uv",
+        "uv",
+        [
+            _VERSION_PROBE,
+            ("print('Hello from UV environment!')", ("Hello from UV environment!",)),
+            ("import sys; print(sys.executable)", ()),
+        ],
+    ),
+    "rye": (
+        "test_rye",
+        "rye",
+        [
+            _VERSION_PROBE,
+            (
+                "import platform; print(f'Rye env: Python {platform.python_version()}')",
+                ("Rye env: Python",),
+            ),
+        ],
+    ),
+    # requirements.txt and setup.py projects go through auto detection
+    "requirements": (
+        "test_requirements",
+        "auto",
+        [
+            _VERSION_PROBE,
+            (
+                "import pandas, numpy; print(f'pandas {pandas.__version__}, numpy {numpy.__version__}')",
+                ("pandas", "numpy"),
+            ),
+        ],
+    ),
+    "setuppy": (
+        "test_setuppy",
+        "auto",
+        [
+            _VERSION_PROBE,
+            (
+                "import test_setuppy; print('test_setuppy imported successfully')",
+                ("test_setuppy imported successfully",),
+            ),
+        ],
+    ),
+}
+
+
+async def _check_python_case(
+    name, schematics_universal, new_DockerEnvFromSchematics, logger
 ):
-    """Test UV project - build Docker image and verify Python is runnable"""
-    logger.info("Testing UV project Docker build and Python execution")
+    """Build the case's project on python:3.11-slim and check every probe's output"""
+    test_id, kind, probes = _PYTHON_CASES[name]
+    logger.info(f"Testing {test_id} ({kind}) Docker build and Python execution")
 
-    # Create schematic
-    project = ProjectDef(dirs=[ProjectDir("test_uv", kind="uv")])
+    project = ProjectDef(dirs=[ProjectDir(test_id, kind=kind)])
     schematic = await schematics_universal(
         target=project, base_image="python:3.11-slim"
     )
-
-    # Create Docker environment
-    # Note: docker_host should be configured in environment or design
     docker_env = new_DockerEnvFromSchematics(
-        project=project,
-        schematics=schematic,
-        docker_host="zeus",  # Required Docker host for this repo
+        project=project, schematics=schematic, docker_host=_DOCKER_HOST
     )
 
-    # Test 1: Run Python version command
-    result = await docker_env.run_script("python --version")
-    logger.info(f"Python version output: {result.stdout}")
-    assert "Python" in result.stdout, (
-        f"Expected 'Python' in output, got: {result.stdout}"
-    )
-
-    # Test 2: Run Python code
-    result = await docker_env.run_script(
-        "python -c 'print(\"Hello from UV environment!\")'"
-    )
-    logger.info(f"Python hello output: {result.stdout}")
-    assert "Hello from UV environment!" in result.stdout
-
-    # Test 3: Check if UV installed packages
     result = await docker_env.run_script(
-        "python -c 'import sys; print(sys.executable)'"
+        _python_probe(*(snippet for snippet, _ in probes))
     )
-    logger.info(f"Python executable: {result.stdout}")
+    outputs = _probe_outputs(result.stdout, len(probes))
+    for (snippet, expected), output in zip(probes, outputs):
+        logger.info(f"{snippet} -> {output.strip()}")
+        for text in expected:
+            assert text in output, f"Expected {text!r} in output, got: {output}"
 
-    logger.info("✅ UV Docker Python test passed")
+    logger.info(f"✅ {test_id} Docker Python test passed")
 
 
-# ===== Test Rye Project Docker Run =====
+# injected_pytest tests cannot take parametrize arguments, so each case keeps a
+# thin test function (selectable with -k) over the shared body above.
 @injected_pytest(test_design)
-async def test_rye_docker_python(
+async def test_uv_docker_python(
     schematics_universal, new_DockerEnvFromSchematics, logger
 ):
-    """Test Rye project - build Docker image and verify Python is runnable"""
-    logger.info("Testing Rye project Docker build and Python execution")
-
-    # Create schematic
-    project = ProjectDef(dirs=[ProjectDir("test_rye", kind="rye")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
-    )
-
-    # Create Docker environment
-    docker_env = new_DockerEnvFromSchematics(
-        project=project, schematics=schematic, docker_host="zeus"
+    """Test UV project - build Docker image and verify Python is runnable"""
+    await _check_python_case(
+        "uv", schematics_universal, new_DockerEnvFromSchematics, logger
     )
 
-    # Test Python availability
-    result = await docker_env.run_script("python --version")
-    logger.info(f"Python version output: {result.stdout}")
-    assert "Python" in result.stdout, (
-        f"Expected 'Python' in output, got: {result.stdout}"
-    )
 
-    # Test Python execution
-    result = await docker_env.run_script(
-        "python -c 'import platform; print(f\"Rye env: Python {platform.python_version()}\")'"
+@injected_pytest(test_design)
+async def test_rye_docker_python(
+    schematics_universal, new_DockerEnvFromSchematics, logger
+):
+    """Test Rye project - build Docker image and verify Python is runnable"""
+    await _check_python_case(
+        "rye", schematics_universal, new_DockerEnvFromSchematics, logger
     )
-    logger.info(f"Platform info: {result.stdout}")
-    assert "Rye env: Python" in result.stdout
-
-    logger.info("✅ Rye Docker Python test passed")
 
 
-# ===== Test Requirements.txt Project Docker Run =====
 @injected_pytest(test_design)
 async def test_requirements_docker_python(
     schematics_universal, new_DockerEnvFromSchematics, logger
 ):
     """Test requirements.txt project (via auto) - build Docker image and verify Python is runnable"""
-    logger.info("Testing requirements.txt project Docker build and Python execution")
-
-    # Create schematic with auto detection
-    project = ProjectDef(dirs=[ProjectDir("test_requirements", kind="auto")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
-    )
-
-    # Create Docker environment
-    docker_env = new_DockerEnvFromSchematics(
-        project=project, schematics=schematic, docker_host="zeus"
-    )
-
-    # Test Python availability
-    result = await docker_env.run_script("python --version")
-    logger.info(f"Python version output: {result.stdout}")
-    assert "Python" in result.stdout, (
-        f"Expected 'Python' in output, got: {result.stdout}"
-    )
-
-    # Test that packages from requirements.txt are installed
-    result = await docker_env.run_script(
-        "python -c 'import pandas; import numpy; print(f\"pandas {pandas.__version__}, numpy {numpy.__version__}\")'"
-    )
-    logger.info(f"Package versions: {result.stdout}")
-    assert "pandas" in result.stdout and "numpy" in result.stdout, (
-        f"Expected pandas and numpy versions, got: {result.stdout}"
+    await _check_python_case(
+        "requirements", schematics_universal, new_DockerEnvFromSchematics, logger
     )
 
-    logger.info("✅ Requirements.txt Docker Python test passed")
-
 
-# ===== Test Setup.py Project Docker Run =====
 @injected_pytest(test_design)
 async def test_setuppy_docker_python(
     schematics_universal, new_DockerEnvFromSchematics, logger
 ):
     """Test setup.py project (via auto) - build Docker image and verify Python is runnable"""
-    logger.info("Testing setup.py project Docker build and Python execution")
-
-    # Create schematic with auto detection
-    project = ProjectDef(dirs=[ProjectDir("test_setuppy", kind="auto")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
-    )
-
-    # Create Docker environment
-    docker_env = new_DockerEnvFromSchematics(
-        project=project, schematics=schematic, docker_host="zeus"
-    )
-
-    # Test Python availability
-    result = await docker_env.run_script("python --version")
-    logger.info(f"Python version output: {result.stdout}")
-    assert "Python" in result.stdout, (
-        f"Expected 'Python' in output, got: {result.stdout}"
+    await _check_python_case(
+        "setuppy", schematics_universal, new_DockerEnvFromSchematics, logger
     )
 
-    # Test that the package is installed
-    result = await docker_env.run_script(
-        "python -c 'import test_setuppy; print(f\"test_setuppy imported successfully\")'"
-    )
-    logger.info(f"Package import: {result.stdout}")
-    assert "test_setuppy imported successfully" in result.stdout
-
-    logger.info("✅ Setup.py Docker Python test passed")
-
 
 # ===== Test Source Project (No Python) Docker Run =====
 @injected_pytest(test_design)
@@ -206,26 +199,23 @@ async def test_source_docker_no_python(
 
     # Create Docker environment
     docker_env = new_DockerEnvFromSchematics(
-        project=project, schematics=schematic, docker_host="zeus"
+        project=project, schematics=schematic, docker_host=_DOCKER_HOST
     )
 
-    # Test that Python is NOT available (source projects don't set up Python)
-    try:
-        result = await docker_env.run_script("python --version")
-        # If we get here, Python exists when it shouldn't
-        assert False, (
-            f"Python should not be available in source project, but got: {result.stdout}"
+    # Basic shell commands should work, but Python is NOT available
+    # (source projects don't set up Python). Both run in one docker run:
+    # the echo first, then python, whose failure fails the script.
+    with pytest.raises(CommandException) as exc_info:
+        await docker_env.run_script(
+            "echo 'Hello from source environment'\npython --version"
         )
-    except Exception as e:
-        # Expected - Python should not be available
-        logger.info(f"Expected error (Python not found): {e!s}")
-        assert "command not found" in str(e) or "No such file" in str(e), (
-            f"Expected 'command not found' error, got: {e}"
-        )
-
-    # But basic shell commands should work
-    result = await docker_env.run_script("echo 'Hello from source environment'")
-    logger.info(f"Echo output: {result.stdout}")
-    assert "Hello from source environment" in result.stdout
+    e = exc_info.value
+    logger.info(f"Expected failure (Python not found): code={e.code}, stderr={e.stderr}")
+    assert e.code != 0
+    assert "command not found" in e.stderr or "No such file" in e.stderr, (
+        f"Expected 'command not found' error, got: {e.stderr}"
+    )
+    # The echo before it still ran
+    assert "Hello from source environment" in e.stdout
 
     logger.info("✅ Source Docker (no Python) test passed")
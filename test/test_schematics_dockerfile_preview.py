@@ -4,47 +4,89 @@ This test verifies that correct Dockerfiles are generated for
 each type of project (source, resource, uv, rye, etc).
 """
 
-from pathlib import Path
+import asyncio
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
 from loguru import logger
-
-# Setup test environment
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
-
-_storage_resolver = StaticStorageResolver(
-    {
-        "test_source": TEST_PROJECT_ROOT / "test_source",
-        "test_resource": TEST_PROJECT_ROOT / "test_resource",
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-        "test_rye": TEST_PROJECT_ROOT / "test_rye",
-        "test_setuppy": TEST_PROJECT_ROOT / "test_setuppy",
-        "test_requirements": TEST_PROJECT_ROOT / "test_requirements",
-    }
-)
+from test._common_design import SHORT_NAME_RESOLVER
 
 # Test design configuration
 _design = load_env_design + design(
-    storage_resolver=_storage_resolver, 
+    storage_resolver=SHORT_NAME_RESOLVER,
     logger=logger
 )
 
 
+# Every (project, base_image, extra kwargs) this module previews, by name
+_CASES = {
+    "source": (
+        ProjectDef(dirs=[ProjectDir("test_source", kind="source")]),
+        "ubuntu:22.04",
+        {},
+    ),
+    "uv": (
+        ProjectDef(dirs=[ProjectDir("test_uv", kind="uv")]),
+        "python:3.11-slim",
+        {},
+    ),
+    "rye": (
+        ProjectDef(dirs=[ProjectDir("test_rye", kind="rye")]),
+        "python:3.11-slim",
+        {},
+    ),
+    "setuppy": (
+        ProjectDef(dirs=[ProjectDir("test_setuppy", kind="setup.py")]),
+        "python:3.11-slim",
+        {"python_version": "3.11"},
+    ),
+    "mixed": (
+        ProjectDef(
+            dirs=[
+                ProjectDir("test_uv", kind="uv"),
+                ProjectDir("test_resource", kind="resource"),
+                ProjectDir("test_source", kind="source"),
+            ]
+        ),
+        "python:3.11-slim",
+        {},
+    ),
+}
+
+# case name -> generated Dockerfile, shared by the tests of this module
+_DOCKERFILES: dict[str, str] = {}
+
+
+async def _dockerfile(schematics_universal, name: str) -> str:
+    """Dockerfile of the named case. The first miss generates every missing
+    case concurrently, so the remaining tests only read the cache.
+    Only successes are cached, and a failure is raised only for the named case."""
+    if name not in _DOCKERFILES:
+        missing = [key for key in _CASES if key not in _DOCKERFILES]
+        schematics = await asyncio.gather(
+            *[
+                schematics_universal(target=target, base_image=base_image, **kwargs)
+                for target, base_image, kwargs in (_CASES[key] for key in missing)
+            ],
+            return_exceptions=True,
+        )
+        for key, schematic in zip(missing, schematics):
+            if isinstance(schematic, BaseException):
+                if key == name:
+                    raise schematic
+            else:
+                _DOCKERFILES[key] = schematic.builder.dockerfile
+    return _DOCKERFILES[name]
+
+
 # ===== Test 1: Source kind Dockerfile =====
 @injected_pytest(_design)
 async def test_source_dockerfile_generation(schematics_universal, logger):
     """Test Dockerfile generation for source kind"""
     logger.info("Testing source kind Dockerfile generation")
 
-    schematic = await schematics_universal(
-        target=ProjectDef(dirs=[ProjectDir("test_source", kind="source")]),
-        base_image="ubuntu:22.04",
-    )
-
-    dockerfile = schematic.builder.dockerfile
+    dockerfile = await _dockerfile(schematics_universal, "source")
 
     # Verify basic structure
     assert "FROM ubuntu:22.04" in dockerfile
@@ -59,17 +101,15 @@ async def test_uv_dockerfile_generation(schematics_universal, logger):
     """Test Dockerfile generation for UV kind"""
     logger.info("Testing UV kind Dockerfile generation")
 
-    schematic = await schematics_universal(
-        target=ProjectDef(dirs=[ProjectDir("test_uv", kind="uv")]),
-        base_image="python:3.11-slim",
-    )
-
-    dockerfile = schematic.builder.dockerfile
+    dockerfile = await _dockerfile(schematics_universal, "uv")
 
     # Verify UV-specific content
     assert "FROM python:3.11-slim" in dockerfile
     assert "uv" in dockerfile.lower(), "UV kind should reference uv tool"
     assert "pyproject.toml" in dockerfile, "UV projects use pyproject.toml"
+    assert "--mount=type=cache,target=/var/cache/apt" in dockerfile, (
+        "apt installs should reuse the BuildKit package cache"
+    )
 
     logger.info("✅ UV Dockerfile verified")
 
@@ -80,12 +120,7 @@ async def test_rye_dockerfile_generation(schematics_universal, logger):
     """Test Dockerfile generation for Rye kind"""
     logger.info("Testing Rye kind Dockerfile generation")
 
-    schematic = await schematics_universal(
-        target=ProjectDef(dirs=[ProjectDir("test_rye", kind="rye")]),
-        base_image="python:3.11-slim",
-    )
-
-    dockerfile = schematic.builder.dockerfile
+    dockerfile = await _dockerfile(schematics_universal, "rye")
 
     # Verify Rye-specific content
     assert "FROM python:3.11-slim" in dockerfile
@@ -100,13 +135,7 @@ async def test_setuppy_dockerfile_generation(schematics_universal, logger):
     """Test Dockerfile generation for setup.py kind"""
     logger.info("Testing setup.py kind Dockerfile generation")
 
-    schematic = await schematics_universal(
-        target=ProjectDef(dirs=[ProjectDir("test_setuppy", kind="setup.py")]),
-        base_image="python:3.11-slim",
-        python_version="3.11",
-    )
-
-    dockerfile = schematic.builder.dockerfile
+    dockerfile = await _dockerfile(schematics_universal, "setuppy")
 
     # Verify setup.py-specific content
     assert "FROM python:3.11-slim" in dockerfile
@@ -122,18 +151,7 @@ async def test_mixed_dockerfile_generation(schematics_universal, logger):
     """Test Dockerfile generation for mixed project kinds"""
     logger.info("Testing mixed kinds Dockerfile generation")
 
-    schematic = await schematics_universal(
-        target=ProjectDef(
-            dirs=[
-                ProjectDir("test_uv", kind="uv"),
-                ProjectDir("test_resource", kind="resource"),
-                ProjectDir("test_source", kind="source"),
-            ]
-        ),
-        base_image="python:3.11-slim",
-    )
-
-    dockerfile = schematic.builder.dockerfile
+    dockerfile = await _dockerfile(schematics_universal, "mixed")
 
     # Verify it handles multiple kinds
     assert "FROM python:3.11-slim" in dockerfile
@@ -150,12 +168,7 @@ async def test_mixed_dockerfile_generation(schematics_universal, logger):
 @injected_pytest(_design)
 async def test_print_source_dockerfile(schematics_universal, logger):
     """Print and verify source kind Dockerfile"""
-    schematic = await schematics_universal(
-        target=ProjectDef(dirs=[ProjectDir("test_source", kind="source")]),
-        base_image="ubuntu:22.04",
-    )
-    
-    dockerfile = schematic.builder.dockerfile
+    dockerfile = await _dockerfile(schematics_universal, "source")
     
     logger.info(f"\n{'=' * 60}")
     logger.info(f"Dockerfile for SOURCE kind")
@@ -170,12 +183,7 @@ async def test_print_source_dockerfile(schematics_universal, logger):
 @injected_pytest(_design)
 async def test_print_uv_dockerfile(schematics_universal, logger):
     """Print and verify UV kind Dockerfile"""
-    schematic = await schematics_universal(
-        target=ProjectDef(dirs=[ProjectDir("test_uv", kind="uv")]),
-        base_image="python:3.11-slim",
-    )
-    
-    dockerfile = schematic.builder.dockerfile
+    dockerfile = await _dockerfile(schematics_universal, "uv")
     
     logger.info(f"\n{'=' * 60}")
     logger.info(f"Dockerfile for UV kind")
@@ -4,27 +4,15 @@ This demonstrates the standard pattern for writing tests with the
 @injected_pytest decorator.
 """
 
-from pathlib import Path
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
 from loguru import logger
+from test._common_design import SHORT_NAME_RESOLVER
 
-# Create storage resolver for test projects
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
-
-test_storage_resolver = StaticStorageResolver(
-    {
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-        "test_rye": TEST_PROJECT_ROOT / "test_rye",
-        "test_setuppy": TEST_PROJECT_ROOT / "test_setuppy",
-        "test_requirements": TEST_PROJECT_ROOT / "test_requirements",
-        "test_source": TEST_PROJECT_ROOT / "test_source",
-        "test_resource": TEST_PROJECT_ROOT / "test_resource",
-    }
-)
+# Storage resolver for the dummy test projects, shared with other modules
+test_storage_resolver = SHORT_NAME_RESOLVER
 
 # Test design configuration
 test_design = load_env_design + design(storage_resolver=test_storage_resolver, logger=logger)
@@ -43,9 +31,7 @@ async def test_uv_kind(schematics_universal, logger):
     )
 
     builder = schematic.builder
-    scripts_str = " ".join(builder.scripts)
-
-    assert "uv sync" in scripts_str, "UV sync command not found"
+    assert any("uv sync" in s for s in builder.scripts), "UV sync command not found"
     assert builder.base_image == "python:3.11-slim"
     logger.info(f"✓ UV test passed - found {len(builder.scripts)} scripts")
 
@@ -60,9 +46,7 @@ async def test_rye_kind(schematics_universal, logger):
     )
 
     builder = schematic.builder
-    scripts_str = " ".join(builder.scripts)
-
-    assert "rye sync" in scripts_str, "Rye sync command not found"
+    assert any("rye sync" in s for s in builder.scripts), "Rye sync command not found"
     assert builder.base_image == "python:3.11-slim"
     logger.info(f"✓ RYE test passed - found {len(builder.scripts)} scripts")
 
@@ -77,9 +61,9 @@ async def test_auto_setuppy(schematics_universal, logger):
     )
 
     builder = schematic.builder
-    scripts_str = " ".join(builder.scripts)
-
-    assert "pip install -e ." in scripts_str, "pip install -e . not found for setup.py"
+    assert any("pip install -e ." in s for s in builder.scripts), (
+        "pip install -e . not found for setup.py"
+    )
     logger.info("✓ Auto-detection (setup.py) test passed")
 
 
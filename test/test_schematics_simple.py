@@ -1,32 +1,39 @@
 """Test schematics_universal with different ProjectDir kinds using @injected_pytest"""
 
-from pathlib import Path
+import asyncio
+
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
+from ml_nexus.schematics import ContainerSchematic
 from loguru import logger
+from test._common_design import SHORT_NAME_RESOLVER
 
-# Create storage resolver for test projects
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
-
-test_storage_resolver = StaticStorageResolver(
-    {
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-        "test_rye": TEST_PROJECT_ROOT / "test_rye",
-        "test_setuppy": TEST_PROJECT_ROOT / "test_setuppy",
-        "test_requirements": TEST_PROJECT_ROOT / "test_requirements",
-        "test_source": TEST_PROJECT_ROOT / "test_source",
-        "test_resource": TEST_PROJECT_ROOT / "test_resource",
-    }
-)
+# Storage resolver for the dummy test projects, shared with other modules
+test_storage_resolver = SHORT_NAME_RESOLVER
 
 # Test design configuration
 test_design = load_env_design + design(storage_resolver=test_storage_resolver, logger=logger)
 
 # Module design configuration - removed deprecated __meta_design__
 
+# (project_id, kind, base_image) -> schematic. test_all_project_kinds repeats
+# the combinations of the per-kind tests; these tests only inspect the builder.
+_SCHEMATICS: dict[tuple[str, str, str], ContainerSchematic] = {}
+
+
+async def _schematic(
+    schematics_universal, project_id: str, kind: str, base_image: str
+) -> ContainerSchematic:
+    key = (project_id, kind, base_image)
+    if key not in _SCHEMATICS:
+        _SCHEMATICS[key] = await schematics_universal(
+            target=ProjectDef(dirs=[ProjectDir(project_id, kind=kind)]),
+            base_image=base_image,
+        )
+    return _SCHEMATICS[key]
+
 
 # Test UV project
 @injected_pytest(test_design)
@@ -36,9 +43,8 @@ async def test_uv_project(schematics_universal, logger):
     logger.info("Testing UV kind with project: test_uv")
     logger.info(f"{'=' * 60}")
 
-    project = ProjectDef(dirs=[ProjectDir("test_uv", kind="uv")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
+    schematic = await _schematic(
+        schematics_universal, "test_uv", "uv", "python:3.11-slim"
     )
 
     builder = schematic.builder
@@ -47,8 +53,7 @@ async def test_uv_project(schematics_universal, logger):
     logger.info(f"Scripts count: {len(builder.scripts)}")
 
     # Verify UV-specific configuration
-    scripts_str = " ".join(builder.scripts)
-    assert "uv sync" in scripts_str, "UV sync command not found"
+    assert any("uv sync" in s for s in builder.scripts), "UV sync command not found"
     assert builder.base_image == "python:3.11-slim"
 
 
@@ -60,9 +65,8 @@ async def test_rye_project(schematics_universal, logger):
     logger.info("Testing RYE kind with project: test_rye")
     logger.info(f"{'=' * 60}")
 
-    project = ProjectDef(dirs=[ProjectDir("test_rye", kind="rye")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
+    schematic = await _schematic(
+        schematics_universal, "test_rye", "rye", "python:3.11-slim"
     )
 
     builder = schematic.builder
@@ -71,8 +75,7 @@ async def test_rye_project(schematics_universal, logger):
     logger.info(f"Scripts count: {len(builder.scripts)}")
 
     # Verify Rye-specific configuration
-    scripts_str = " ".join(builder.scripts)
-    assert "rye sync" in scripts_str, "Rye sync command not found"
+    assert any("rye sync" in s for s in builder.scripts), "Rye sync command not found"
 
 
 # Test auto-detection with requirements.txt
@@ -83,9 +86,8 @@ async def test_auto_requirements(schematics_universal, logger):
     logger.info("Testing AUTO kind with project: test_requirements")
     logger.info(f"{'=' * 60}")
 
-    project = ProjectDef(dirs=[ProjectDir("test_requirements", kind="auto")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
+    schematic = await _schematic(
+        schematics_universal, "test_requirements", "auto", "python:3.11-slim"
     )
 
     builder = schematic.builder
@@ -108,8 +110,9 @@ async def test_source_project(schematics_universal, logger):
     logger.info("Testing SOURCE kind with project: test_source")
     logger.info(f"{'=' * 60}")
 
-    project = ProjectDef(dirs=[ProjectDir("test_source", kind="source")])
-    schematic = await schematics_universal(target=project, base_image="ubuntu:22.04")
+    schematic = await _schematic(
+        schematics_universal, "test_source", "source", "ubuntu:22.04"
+    )
 
     builder = schematic.builder
     logger.info(f"Base image: {builder.base_image}")
@@ -132,13 +135,18 @@ async def test_all_project_kinds(schematics_universal, logger):
         ("test_source", "source", None, "ubuntu:22.04"),
     ]
 
-    for project_id, kind, expected_command, expected_base_image in test_cases:
-        logger.info(f"\nTesting {kind} project: {project_id}")
+    # the cases are independent; generate any not cached yet concurrently
+    schematics = await asyncio.gather(
+        *[
+            _schematic(schematics_universal, project_id, kind, base_image)
+            for project_id, kind, _, base_image in test_cases
+        ]
+    )
 
-        project = ProjectDef(dirs=[ProjectDir(project_id, kind=kind)])
-        schematic = await schematics_universal(
-            target=project, base_image=expected_base_image
-        )
+    for (project_id, kind, expected_command, expected_base_image), schematic in zip(
+        test_cases, schematics
+    ):
+        logger.info(f"\nTesting {kind} project: {project_id}")
 
         builder = schematic.builder
         scripts_str = " ".join(builder.scripts)
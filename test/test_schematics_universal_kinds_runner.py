@@ -1,26 +1,25 @@
 """Test different ProjectDir kinds with schematics_universal and DockerEnvFromSchematics"""
 
 from pathlib import Path
+import pytest
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
 from ml_nexus.storage_resolver import StaticStorageResolver
 from loguru import logger
+from test._common_design import (
+    SESSION_BUILD_CACHE,
+    SHORT_NAME_RESOLVER,
+    TEST_DOCKER_CACHE_FROM,
+)
 
-# Create storage resolver for test projects
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
 REPO_ROOT = Path(__file__).parent.parent
 
-test_storage_resolver = StaticStorageResolver(
+# The dummy projects come from the shared resolver; only the repo
+# directories are specific to this module
+test_storage_resolver = SHORT_NAME_RESOLVER + StaticStorageResolver(
     {
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-        "test_rye": TEST_PROJECT_ROOT / "test_rye",
-        "test_setuppy": TEST_PROJECT_ROOT / "test_setuppy",
-        "test_requirements": TEST_PROJECT_ROOT / "test_requirements",
-        "test_source": TEST_PROJECT_ROOT / "test_source",
-        "test_resource": TEST_PROJECT_ROOT / "test_resource",
-        # Add mappings for actual directories used in tests
         "ml_nexus": REPO_ROOT,  # For the current project root
         "src/ml_nexus": REPO_ROOT / "src" / "ml_nexus",
         "doc": REPO_ROOT / "doc",
@@ -29,7 +28,12 @@ test_storage_resolver = StaticStorageResolver(
 
 # Test design configuration
 test_design = load_env_design + design(
-    docker_host="zeus", storage_resolver=test_storage_resolver, logger=logger
+    docker_host="zeus",
+    storage_resolver=test_storage_resolver,
+    logger=logger,
+    # identical build contexts (auto and uv kind of test_uv) are re-tagged, not rebuilt
+    docker_build_digest_cache=SESSION_BUILD_CACHE,
+    ml_nexus_docker_cache_from=TEST_DOCKER_CACHE_FROM,
 )
 
 # Module design configuration
@@ -37,6 +41,7 @@ test_design = load_env_design + design(
 
 
 # Test source kind - no Python environment
+@pytest.mark.zeus
 @injected_pytest(test_design)
 async def test_source_kind(schematics_universal, new_DockerEnvFromSchematics, logger):
     """Test source kind with no Python environment"""
@@ -60,6 +65,7 @@ async def test_source_kind(schematics_universal, new_DockerEnvFromSchematics, lo
 
 
 # Test resource kind
+@pytest.mark.zeus
 @injected_pytest(test_design)
 async def test_resource_kind(schematics_universal, new_DockerEnvFromSchematics, logger):
     """Test resource kind for mounting resources"""
@@ -81,6 +87,7 @@ async def test_resource_kind(schematics_universal, new_DockerEnvFromSchematics,
 
 
 # Test auto kind - will auto-detect project type
+@pytest.mark.zeus
 @injected_pytest(test_design)
 async def test_auto_kind(schematics_universal, new_DockerEnvFromSchematics, logger):
     """Test auto kind that auto-detects project type"""
@@ -107,6 +114,7 @@ async def test_auto_kind(schematics_universal, new_DockerEnvFromSchematics, logg
 
 
 # Test UV kind with persistent container
+@pytest.mark.zeus
 @injected_pytest(test_design)
 async def test_uv_kind_persistent(
     schematics_universal, new_PersistentDockerEnvFromSchematics, logger
@@ -144,6 +152,7 @@ async def test_uv_kind_persistent(
 
 
 # Test mixed kinds - UV + resource
+@pytest.mark.zeus
 @injected_pytest(test_design)
 async def test_mixed_kinds(schematics_universal, new_DockerEnvFromSchematics, logger):
     """Test mixed project with UV and resource kinds"""
@@ -4,27 +4,18 @@ This test verifies that the correct macros and scripts are generated
 for each type of project (UV, Rye, setup.py, etc).
 """
 
-from pathlib import Path
+import asyncio
+
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
+from ml_nexus.schematics import ContainerSchematic
 from loguru import logger
+from test._common_design import SHORT_NAME_RESOLVER
 
-# Create storage resolver for test projects
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
-
-_storage_resolver = StaticStorageResolver(
-    {
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-        "test_rye": TEST_PROJECT_ROOT / "test_rye",
-        "test_setuppy": TEST_PROJECT_ROOT / "test_setuppy",
-        "test_requirements": TEST_PROJECT_ROOT / "test_requirements",
-        "test_source": TEST_PROJECT_ROOT / "test_source",
-        "test_resource": TEST_PROJECT_ROOT / "test_resource",
-    }
-)
+# Storage resolver for the dummy test projects, shared with other modules
+_storage_resolver = SHORT_NAME_RESOLVER
 
 # Test design configuration
 _design = load_env_design + design(
@@ -32,6 +23,45 @@ _design = load_env_design + design(
     logger=logger
 )
 
+# (project_id, kind, base_image, python_version) -> schematic. The analyze and
+# verify-all tests repeat the per-kind combinations and only inspect the builder.
+_SCHEMATICS: dict[tuple[str, str, str, str | None], ContainerSchematic] = {}
+
+
+async def _schematic(
+    schematics_universal,
+    project_id: str,
+    kind: str,
+    base_image: str,
+    python_version: str | None = None,
+) -> ContainerSchematic:
+    key = (project_id, kind, base_image, python_version)
+    if key not in _SCHEMATICS:
+        kwargs = dict(python_version=python_version) if python_version else {}
+        _SCHEMATICS[key] = await schematics_universal(
+            target=ProjectDef(dirs=[ProjectDir(project_id, kind=kind)]),
+            base_image=base_image,
+            **kwargs,
+        )
+    return _SCHEMATICS[key]
+
+
+def _analysis_report(kind_label: str, schematic: ContainerSchematic) -> str:
+    """One multi-line log record summarizing a schematic's builder"""
+    builder = schematic.builder
+    lines = [
+        "=" * 60,
+        f"Analysis for {kind_label} kind",
+        "=" * 60,
+        f"Base image: {builder.base_image}",
+        f"Macros count: {len(builder.macros)}",
+        f"Scripts count: {len(builder.scripts)}",
+        f"Mount requests: {len(schematic.mount_requests)}",
+        # Show first few scripts
+        *(f"Script {i}: {script[:80]}..." for i, script in enumerate(builder.scripts[:3])),
+    ]
+    return "\n" + "\n".join(lines)
+
 
 # ===== Test 1: UV project macros =====
 @injected_pytest(_design)
@@ -39,9 +69,8 @@ async def test_uv_project_macros(schematics_universal, logger):
     """Test that UV projects generate correct macros and scripts"""
     logger.info("Testing UV project macros and scripts")
 
-    project = ProjectDef(dirs=[ProjectDir("test_uv", kind="uv")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
+    schematic = await _schematic(
+        schematics_universal, "test_uv", "uv", "python:3.11-slim"
     )
 
     builder = schematic.builder
@@ -53,8 +82,9 @@ async def test_uv_project_macros(schematics_universal, logger):
     assert len(builder.macros) > 0, "UV project should have macros"
 
     # Verify scripts contain UV commands
-    scripts_str = " ".join(builder.scripts)
-    assert "uv sync" in scripts_str, "UV project should have 'uv sync' command"
+    assert any("uv sync" in s for s in builder.scripts), (
+        "UV project should have 'uv sync' command"
+    )
 
     logger.info(
         f"✅ UV project: {len(builder.macros)} macros, {len(builder.scripts)} scripts"
@@ -67,9 +97,8 @@ async def test_rye_project_macros(schematics_universal, logger):
     """Test that Rye projects generate correct macros and scripts"""
     logger.info("Testing Rye project macros and scripts")
 
-    project = ProjectDef(dirs=[ProjectDir("test_rye", kind="rye")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
+    schematic = await _schematic(
+        schematics_universal, "test_rye", "rye", "python:3.11-slim"
     )
 
     builder = schematic.builder
@@ -81,8 +110,9 @@ async def test_rye_project_macros(schematics_universal, logger):
     assert len(builder.macros) > 0, "Rye project should have macros"
 
     # Verify scripts contain Rye commands
-    scripts_str = " ".join(builder.scripts)
-    assert "rye sync" in scripts_str, "Rye project should have 'rye sync' command"
+    assert any("rye sync" in s for s in builder.scripts), (
+        "Rye project should have 'rye sync' command"
+    )
 
     logger.info(
         f"✅ Rye project: {len(builder.macros)} macros, {len(builder.scripts)} scripts"
@@ -95,9 +125,8 @@ async def test_setuppy_project_macros(schematics_universal, logger):
     """Test that setup.py projects generate correct macros and scripts"""
     logger.info("Testing setup.py project macros and scripts")
 
-    project = ProjectDef(dirs=[ProjectDir("test_setuppy", kind="setup.py")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim", python_version="3.11"
+    schematic = await _schematic(
+        schematics_universal, "test_setuppy", "setup.py", "python:3.11-slim", "3.11"
     )
 
     builder = schematic.builder
@@ -125,9 +154,8 @@ async def test_auto_requirements_project_macros(schematics_universal, logger):
     """Test that auto-detected requirements.txt projects generate correct macros"""
     logger.info("Testing auto-detected requirements.txt project")
 
-    project = ProjectDef(dirs=[ProjectDir("test_requirements", kind="auto")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
+    schematic = await _schematic(
+        schematics_universal, "test_requirements", "auto", "python:3.11-slim"
     )
 
     builder = schematic.builder
@@ -155,8 +183,9 @@ async def test_source_project_macros(schematics_universal, logger):
     """Test that source projects don't set up Python environment"""
     logger.info("Testing source project (no Python)")
 
-    project = ProjectDef(dirs=[ProjectDir("test_source", kind="source")])
-    schematic = await schematics_universal(target=project, base_image="ubuntu:22.04")
+    schematic = await _schematic(
+        schematics_universal, "test_source", "source", "ubuntu:22.04"
+    )
 
     builder = schematic.builder
 
@@ -181,8 +210,9 @@ async def test_resource_project_macros(schematics_universal, logger):
     """Test that resource projects don't set up Python environment"""
     logger.info("Testing resource project")
 
-    project = ProjectDef(dirs=[ProjectDir("test_resource", kind="resource")])
-    schematic = await schematics_universal(target=project, base_image="ubuntu:22.04")
+    schematic = await _schematic(
+        schematics_universal, "test_resource", "resource", "ubuntu:22.04"
+    )
 
     builder = schematic.builder
 
@@ -214,14 +244,21 @@ async def test_verify_all_macros(schematics_universal, logger):
         ("Source", ProjectDir("test_source", kind="source"), None),
     ]
 
-    results = []
-    for name, project_dir, expected_command in test_cases:
-        project = ProjectDef(dirs=[project_dir])
-        schematic = await schematics_universal(
-            target=project,
-            base_image="python:3.11-slim" if expected_command else "ubuntu:22.04",
-        )
+    # the kinds are independent; generate any not cached yet concurrently
+    schematics = await asyncio.gather(
+        *[
+            _schematic(
+                schematics_universal,
+                project_dir.id,
+                project_dir.kind,
+                "python:3.11-slim" if expected_command else "ubuntu:22.04",
+            )
+            for _, project_dir, expected_command in test_cases
+        ]
+    )
 
+    results = []
+    for (name, _, expected_command), schematic in zip(test_cases, schematics):
         builder = schematic.builder
         scripts_str = " ".join(builder.scripts)
 
@@ -253,25 +290,13 @@ async def test_verify_all_macros(schematics_universal, logger):
 @injected_pytest(_design)
 async def test_analyze_uv_schematic(schematics_universal, logger):
     """Analyze the macros and scripts in UV schematic"""
-    project = ProjectDef(dirs=[ProjectDir("test_uv", kind="uv")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
+    schematic = await _schematic(
+        schematics_universal, "test_uv", "uv", "python:3.11-slim"
     )
     
     builder = schematic.builder
 
-    logger.info(f"\n{'=' * 60}")
-    logger.info(f"Analysis for UV kind")
-    logger.info(f"{'=' * 60}")
-
-    logger.info(f"Base image: {builder.base_image}")
-    logger.info(f"Macros count: {len(builder.macros)}")
-    logger.info(f"Scripts count: {len(builder.scripts)}")
-    logger.info(f"Mount requests: {len(schematic.mount_requests)}")
-
-    # Show first few scripts
-    for i, script in enumerate(builder.scripts[:3]):
-        logger.info(f"Script {i}: {script[:80]}...")
+    logger.info(_analysis_report("UV", schematic))
 
     # Verify analysis results
     assert builder.base_image == "python:3.11-slim"
@@ -283,25 +308,13 @@ async def test_analyze_uv_schematic(schematics_universal, logger):
 @injected_pytest(_design)
 async def test_analyze_rye_schematic(schematics_universal, logger):
     """Analyze the macros and scripts in Rye schematic"""
-    project = ProjectDef(dirs=[ProjectDir("test_rye", kind="rye")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
+    schematic = await _schematic(
+        schematics_universal, "test_rye", "rye", "python:3.11-slim"
     )
     
     builder = schematic.builder
 
-    logger.info(f"\n{'=' * 60}")
-    logger.info(f"Analysis for RYE kind")
-    logger.info(f"{'=' * 60}")
-
-    logger.info(f"Base image: {builder.base_image}")
-    logger.info(f"Macros count: {len(builder.macros)}")
-    logger.info(f"Scripts count: {len(builder.scripts)}")
-    logger.info(f"Mount requests: {len(schematic.mount_requests)}")
-
-    # Show first few scripts
-    for i, script in enumerate(builder.scripts[:3]):
-        logger.info(f"Script {i}: {script[:80]}...")
+    logger.info(_analysis_report("RYE", schematic))
 
     # Verify analysis results
     assert builder.base_image == "python:3.11-slim"
@@ -313,25 +326,13 @@ async def test_analyze_rye_schematic(schematics_universal, logger):
 @injected_pytest(_design)
 async def test_analyze_setuppy_schematic(schematics_universal, logger):
     """Analyze the macros and scripts in Setup.py schematic"""
-    project = ProjectDef(dirs=[ProjectDir("test_setuppy", kind="setup.py")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim", python_version="3.11"
+    schematic = await _schematic(
+        schematics_universal, "test_setuppy", "setup.py", "python:3.11-slim", "3.11"
     )
     
     builder = schematic.builder
 
-    logger.info(f"\n{'=' * 60}")
-    logger.info(f"Analysis for SETUP.PY kind")
-    logger.info(f"{'=' * 60}")
-
-    logger.info(f"Base image: {builder.base_image}")
-    logger.info(f"Macros count: {len(builder.macros)}")
-    logger.info(f"Scripts count: {len(builder.scripts)}")
-    logger.info(f"Mount requests: {len(schematic.mount_requests)}")
-
-    # Show first few scripts
-    for i, script in enumerate(builder.scripts[:3]):
-        logger.info(f"Script {i}: {script[:80]}...")
+    logger.info(_analysis_report("SETUP.PY", schematic))
 
     # Verify analysis results
     assert builder.base_image == "python:3.11-slim"
@@ -343,25 +344,13 @@ async def test_analyze_setuppy_schematic(schematics_universal, logger):
 @injected_pytest(_design)
 async def test_analyze_auto_schematic(schematics_universal, logger):
     """Analyze the macros and scripts in Auto-detected requirements.txt schematic"""
-    project = ProjectDef(dirs=[ProjectDir("test_requirements", kind="auto")])
-    schematic = await schematics_universal(
-        target=project, base_image="python:3.11-slim"
+    schematic = await _schematic(
+        schematics_universal, "test_requirements", "auto", "python:3.11-slim"
     )
     
     builder = schematic.builder
 
-    logger.info(f"\n{'=' * 60}")
-    logger.info(f"Analysis for AUTO (requirements.txt) kind")
-    logger.info(f"{'=' * 60}")
-
-    logger.info(f"Base image: {builder.base_image}")
-    logger.info(f"Macros count: {len(builder.macros)}")
-    logger.info(f"Scripts count: {len(builder.scripts)}")
-    logger.info(f"Mount requests: {len(schematic.mount_requests)}")
-
-    # Show first few scripts
-    for i, script in enumerate(builder.scripts[:3]):
-        logger.info(f"Script {i}: {script[:80]}...")
+    logger.info(_analysis_report("AUTO (requirements.txt)", schematic))
 
     # Verify analysis results
     assert builder.base_image == "python:3.11-slim"
@@ -373,25 +362,13 @@ async def test_analyze_auto_schematic(schematics_universal, logger):
 @injected_pytest(_design)
 async def test_analyze_source_schematic(schematics_universal, logger):
     """Analyze the macros and scripts in Source schematic"""
-    project = ProjectDef(dirs=[ProjectDir("test_source", kind="source")])
-    schematic = await schematics_universal(
-        target=project, base_image="ubuntu:22.04"
+    schematic = await _schematic(
+        schematics_universal, "test_source", "source", "ubuntu:22.04"
     )
     
     builder = schematic.builder
 
-    logger.info(f"\n{'=' * 60}")
-    logger.info(f"Analysis for SOURCE kind")
-    logger.info(f"{'=' * 60}")
-
-    logger.info(f"Base image: {builder.base_image}")
-    logger.info(f"Macros count: {len(builder.macros)}")
-    logger.info(f"Scripts count: {len(builder.scripts)}")
-    logger.info(f"Mount requests: {len(schematic.mount_requests)}")
-
-    # Show first few scripts
-    for i, script in enumerate(builder.scripts[:3]):
-        logger.info(f"Script {i}: {script[:80]}...")
+    logger.info(_analysis_report("SOURCE", schematic))
 
     # Verify analysis results
     assert builder.base_image == "ubuntu:22.04"
@@ -402,25 +379,13 @@ async def test_analyze_source_schematic(schematics_universal, logger):
 @injected_pytest(_design)
 async def test_analyze_resource_schematic(schematics_universal, logger):
     """Analyze the macros and scripts in Resource schematic"""
-    project = ProjectDef(dirs=[ProjectDir("test_resource", kind="resource")])
-    schematic = await schematics_universal(
-        target=project, base_image="ubuntu:22.04"
+    schematic = await _schematic(
+        schematics_universal, "test_resource", "resource", "ubuntu:22.04"
     )
     
     builder = schematic.builder
 
-    logger.info(f"\n{'=' * 60}")
-    logger.info(f"Analysis for RESOURCE kind")
-    logger.info(f"{'=' * 60}")
-
-    logger.info(f"Base image: {builder.base_image}")
-    logger.info(f"Macros count: {len(builder.macros)}")
-    logger.info(f"Scripts count: {len(builder.scripts)}")
-    logger.info(f"Mount requests: {len(schematic.mount_requests)}")
-
-    # Show first few scripts
-    for i, script in enumerate(builder.scripts[:3]):
-        logger.info(f"Script {i}: {script[:80]}...")
+    logger.info(_analysis_report("RESOURCE", schematic))
 
     # Verify analysis results
     assert builder.base_image == "ubuntu:22.04"
@@ -4,22 +4,17 @@ This test specifically verifies that UV projects are correctly
 handled by the schematics_universal function.
 """
 
-from pathlib import Path
+from collections import Counter
+
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
 from loguru import logger
+from test._common_design import SHORT_NAME_RESOLVER
 
-# Create storage resolver for test projects
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
-
-test_storage_resolver = StaticStorageResolver(
-    {
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-    }
-)
+# Storage resolver for the dummy test projects, shared with other modules
+test_storage_resolver = SHORT_NAME_RESOLVER
 
 # Test design configuration
 test_design = load_env_design + design(storage_resolver=test_storage_resolver, logger=logger)
@@ -42,52 +37,47 @@ async def test_analyze_uv_schematic(schematics_universal, logger):
 
     builder = schematic.builder
 
-    logger.info(f"\n{'=' * 60}")
-    logger.info("Analysis for UV kind")
-    logger.info(f"{'=' * 60}")
-
     # Verify base image
     assert builder.base_image == "python:3.11-slim"
-    logger.info(f"Base image: {builder.base_image}")
 
     # Verify base stage name exists
     assert hasattr(builder, "base_stage_name")
-    logger.info(f"Base stage name: {builder.base_stage_name}")
 
     # Verify macros
     assert len(builder.macros) > 0, "UV project should have macros"
-    logger.info(f"Macros count: {len(builder.macros)}")
 
     # Analyze macros structure
-    macro_types = {}
-    for macro in builder.macros:
-        macro_type = type(macro).__name__
-        macro_types[macro_type] = macro_types.get(macro_type, 0) + 1
-
-    logger.info("Macro types:")
-    for mtype, count in macro_types.items():
-        logger.info(f"  {mtype}: {count}")
+    macro_types = Counter(type(macro).__name__ for macro in builder.macros)
 
     # Verify scripts
     assert len(builder.scripts) > 0, "UV project should have scripts"
-    logger.info(f"Scripts count: {len(builder.scripts)}")
 
     # Check for UV-specific commands
     scripts_str = " ".join(builder.scripts)
     assert "uv" in scripts_str, "UV project scripts should contain 'uv' command"
     assert "uv sync" in scripts_str, "UV project should run 'uv sync'"
 
-    # Show first few scripts
-    logger.info("First 3 scripts:")
-    for i, script in enumerate(builder.scripts[:3]):
-        logger.info(f"  Script {i}: {script}")
-
-    # Verify mount requests
-    logger.info(f"Mount requests: {len(schematic.mount_requests)}")
-    for i, mount in enumerate(schematic.mount_requests):
-        logger.info(f"  Mount {i}: {type(mount).__name__}")
-
-    logger.info("✅ UV schematic analysis complete")
+    # Emit the whole analysis as one record instead of one per macro/script/mount
+    lines = [
+        "=" * 60,
+        "Analysis for UV kind",
+        "=" * 60,
+        f"Base image: {builder.base_image}",
+        f"Base stage name: {builder.base_stage_name}",
+        f"Macros count: {len(builder.macros)}",
+        "Macro types:",
+        *(f"  {mtype}: {count}" for mtype, count in macro_types.items()),
+        f"Scripts count: {len(builder.scripts)}",
+        "First 3 scripts:",
+        *(f"  Script {i}: {script}" for i, script in enumerate(builder.scripts[:3])),
+        f"Mount requests: {len(schematic.mount_requests)}",
+        *(
+            f"  Mount {i}: {type(mount).__name__}"
+            for i, mount in enumerate(schematic.mount_requests)
+        ),
+        "✅ UV schematic analysis complete",
+    ]
+    logger.info("\n" + "\n".join(lines))
 
 
 # ===== Test UV project specifics =====
@@ -105,9 +95,7 @@ async def test_uv_project_specifics(schematics_universal, logger):
     scripts_str = " ".join(builder.scripts)
 
     # Verify UV installation
-    assert any("uv" in script for script in builder.scripts), (
-        "UV should be referenced in scripts"
-    )
+    assert "uv" in scripts_str, "UV should be referenced in scripts"
 
     # Verify Python version handling - UV uses base image's Python, not explicit version
     # The python_version parameter doesn't affect UV projects since UV manages its own Python
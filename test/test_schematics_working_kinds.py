@@ -1,26 +1,15 @@
 """Test working schematics_universal kinds using @injected_pytest"""
 
-from pathlib import Path
+import asyncio
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
 from loguru import logger
+from test._common_design import SHORT_NAME_RESOLVER
 
-# Create storage resolver for test projects
-TEST_PROJECT_ROOT = Path(__file__).parent / "dummy_projects"
-
-test_storage_resolver = StaticStorageResolver(
-    {
-        "test_uv": TEST_PROJECT_ROOT / "test_uv",
-        "test_rye": TEST_PROJECT_ROOT / "test_rye",
-        "test_setuppy": TEST_PROJECT_ROOT / "test_setuppy",
-        "test_requirements": TEST_PROJECT_ROOT / "test_requirements",
-        "test_source": TEST_PROJECT_ROOT / "test_source",
-        "test_resource": TEST_PROJECT_ROOT / "test_resource",
-    }
-)
+# Storage resolver for the dummy test projects, shared with other modules
+test_storage_resolver = SHORT_NAME_RESOLVER
 
 # Test design configuration
 test_design = load_env_design + design(storage_resolver=test_storage_resolver, logger=logger)
@@ -47,9 +36,7 @@ async def test_working_schematics(schematics_universal, logger):
         ("test_requirements", "auto", "REQUIREMENTS.TXT (via auto)"),
     ]
 
-    results = []
-
-    for project_id, kind, expected_kind in test_cases:
+    async def check(project_id, kind, expected_kind):
         logger.info(f"\n{'=' * 80}")
         logger.info(f"Testing {expected_kind} kind with project: {project_id}")
         logger.info(f"{'=' * 80}")
@@ -63,7 +50,7 @@ async def test_working_schematics(schematics_universal, logger):
             )
 
             builder = schematic.builder
-            logger.info("✓ Successfully created schematic")
+            logger.info(f"✓ Successfully created schematic for {expected_kind}")
             logger.info(f"  Base image: {builder.base_image}")
             logger.info(f"  Macros count: {len(builder.macros)}")
             logger.info(f"  Scripts count: {len(builder.scripts)}")
@@ -84,21 +71,20 @@ async def test_working_schematics(schematics_universal, logger):
                 elif "pip install" in scripts_str and "requirements.txt" in scripts_str:
                     logger.info("  ✓ Found pip install for requirements.txt")
 
-            results.append(
-                {
-                    "kind": expected_kind,
-                    "status": "✓ PASSED",
-                    "macros": len(builder.macros),
-                    "scripts": len(builder.scripts),
-                    "mounts": len(schematic.mount_requests),
-                }
-            )
+            return {
+                "kind": expected_kind,
+                "status": "✓ PASSED",
+                "macros": len(builder.macros),
+                "scripts": len(builder.scripts),
+                "mounts": len(schematic.mount_requests),
+            }
 
         except Exception as e:
-            logger.error(f"✗ Failed: {e!s}")
-            results.append(
-                {"kind": expected_kind, "status": "✗ FAILED", "error": str(e)}
-            )
+            logger.error(f"✗ Failed ({expected_kind}): {e!s}")
+            return {"kind": expected_kind, "status": "✗ FAILED", "error": str(e)}
+
+    # The cases share no state, so their schematics are generated concurrently
+    results = await asyncio.gather(*[check(*case) for case in test_cases])
 
     # Summary
     logger.info(f"\n{'=' * 80}")
@@ -137,13 +123,12 @@ async def test_python_versions_schematics(schematics_universal, logger):
     project = ProjectDef(dirs=[ProjectDir("test_uv", kind="uv")])
     
     versions = ["3.10", "3.11", "3.12", "3.13"]
-    results = []
-    
-    for version in versions:
+
+    async def check(version):
         logger.info(f"\n{'=' * 60}")
         logger.info(f"Testing Python {version}")
         logger.info(f"{'=' * 60}")
-        
+
         try:
             # Generate schematic for this Python version
             schematic = await schematics_universal(
@@ -151,35 +136,35 @@ async def test_python_versions_schematics(schematics_universal, logger):
                 base_image=f"python:{version}-slim",
                 python_version=version
             )
-            
+
             builder = schematic.builder
             logger.info(f"✓ Successfully created schematic for Python {version}")
             logger.info(f"  Base image: {builder.base_image}")
-            
+
             # Check that base image contains the version
             assert version in builder.base_image or f"python{version}" in builder.base_image
-            
-            # Get entrypoint script to verify Python version setup
+
+            # The entrypoint embeds the init scripts, so check for UV commands there
             entrypoint_script = await builder.a_entrypoint_script()
-            
-            # Check for UV commands
-            scripts_str = " ".join(builder.scripts)
-            assert "uv" in scripts_str.lower() or "UV" in scripts_str
-            
-            results.append({
+            assert "uv" in entrypoint_script.lower()
+
+            return {
                 "version": version,
                 "status": "✓ PASSED",
                 "base_image": builder.base_image
-            })
-            
+            }
+
         except Exception as e:
             logger.error(f"✗ Failed for Python {version}: {e!s}")
-            results.append({
+            return {
                 "version": version,
                 "status": "✗ FAILED",
                 "error": str(e)
-            })
-    
+            }
+
+    # The versions share no state, so their schematics are generated concurrently
+    results = await asyncio.gather(*[check(version) for version in versions])
+
     # Summary
     logger.info(f"\n{'=' * 60}")
     logger.info("PYTHON VERSION TEST SUMMARY")
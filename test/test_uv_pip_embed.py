@@ -1,48 +1,74 @@
 """Test to verify uv-pip-embed functionality"""
 
-from pathlib import Path
+import pytest
 from pinjected import design
 from pinjected.test import injected_pytest
-from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
-from loguru import logger
-
-# Configure static resolver for test directories
-_storage_resolver = StaticStorageResolver(
-    {
-        "test/dummy_projects/test_requirements": Path(__file__).parent
-        / "dummy_projects"
-        / "test_requirements",
-        "test/dummy_projects/test_setuppy": Path(__file__).parent
-        / "dummy_projects"
-        / "test_setuppy",
-    }
-)
+from test._common_design import COMMON_DESIGN
+from test.container_pool import session_container_name
+
+# Every test here runs containers on zeus; conftest.py skips them when it is unreachable
+pytestmark = pytest.mark.zeus
 
 # Test design configuration
-_design = load_env_design + design(
-    storage_resolver=_storage_resolver,
-    ml_nexus_docker_build_context="zeus",
-    logger=logger,
+_design = COMMON_DESIGN + design(
     docker_command_info="",  # Add docker_command_info
 )
 
+# Diagnostics logged with every result, ahead of the case's import check.
+# They run in the same interpreter as the imports, so one python startup
+# covers both; the installed packages come from importlib.metadata rather
+# than a second interpreter running `pip list`.
+_DIAGNOSTICS = """import subprocess, sys
+from importlib.metadata import distributions
+print("---")
+print("Python version:", sys.version)
+print("---")
+print("UV version:")
+print(subprocess.run("uv --version", shell=True, capture_output=True, text=True).stdout)
+print("---")
+print("Installed packages:")
+print("\\n".join(sorted(f"{d.metadata['Name']} {d.version}" for d in distributions())))
+print("---")
+print("Which python:", sys.executable)
+print("---")
+print("Testing imports:")
+"""
 
-# Test 1: uv-pip-embed project with requirements.txt
-@injected_pytest(_design)
-async def test_uv_pip_embed_requirements(
-    schematics_universal, new_PersistentDockerEnvFromSchematics, logger
+# test name -> (project id, description, import check, expected substrings).
+# Both cases run the same diagnostics and differ only in the project and
+# what it must be able to import.
+_CASES = {
+    "requirements": (
+        "test/dummy_projects/test_requirements",
+        "requirements.txt",
+        """import requests, pandas, numpy
+print(f"requests version: {requests.__version__}")
+print(f"pandas version: {pandas.__version__}")
+print(f"numpy version: {numpy.__version__}")""",
+        ("requests version:", "pandas version:", "numpy version:"),
+    ),
+    "setuppy": (
+        "test/dummy_projects/test_setuppy",
+        "setup.py",
+        """import numpy, pandas, test_setuppy
+print(f"numpy version: {numpy.__version__}")
+print(f"pandas version: {pandas.__version__}")
+print("test_setuppy imported successfully")""",
+        ("numpy version:", "pandas version:", "test_setuppy imported successfully"),
+    ),
+}
+
+
+async def _check_uv_pip_embed(
+    name, schematics_universal, new_PersistentDockerEnvFromSchematics, logger
 ):
-    """Test uv-pip-embed functionality with requirements.txt"""
-    logger.info("Testing uv-pip-embed with requirements.txt")
+    """Build the case's uv-pip-embed project, run the diagnostics and its imports"""
+    project_id, description, imports, expected = _CASES[name]
+    logger.info(f"Testing uv-pip-embed with {description}")
 
     # Create project definition
-    project = ProjectDef(
-        dirs=[
-            ProjectDir(id="test/dummy_projects/test_requirements", kind="uv-pip-embed")
-        ]
-    )
+    project = ProjectDef(dirs=[ProjectDir(id=project_id, kind="uv-pip-embed")])
 
     # Generate schematics
     schematics = await schematics_universal(target=project, python_version="3.11")
@@ -52,7 +78,7 @@ async def test_uv_pip_embed_requirements(
         project=project,
         schematics=schematics,
         docker_host="zeus",
-        container_name="test_uv_pip_embed_requirements",
+        container_name=session_container_name(f"test_uv_pip_embed_{name}"),
     )
 
     # Ensure container is running
@@ -61,107 +87,42 @@ async def test_uv_pip_embed_requirements(
     try:
         # Run test script
         result = await docker_env.run_script(
-            """
-echo "Testing uv-pip-embed project with requirements.txt"
-echo "---"
-echo "Python version:"
-python --version
-echo "---"
-echo "UV version:"
-uv --version
-echo "---"
-echo "Installed packages:"
-pip list
-echo "---"
-echo "Which python:"
-which python
-echo "---"
-echo "Testing imports:"
-python -c "import requests; print(f'requests version: {requests.__version__}')"
-python -c "import pandas; print(f'pandas version: {pandas.__version__}')"
-python -c "import numpy; print(f'numpy version: {numpy.__version__}')"
-"""
+            f'\necho "Testing uv-pip-embed project with {description}"\n'
+            f"python - <<'PY'\n{_DIAGNOSTICS}{imports}\nPY\n"
         )
 
         logger.info(f"Test result:\n{result.stdout}")
 
         # Verify the test ran successfully
         assert result is not None
-        assert "requests version:" in result.stdout
-        assert "pandas version:" in result.stdout
-        assert "numpy version:" in result.stdout
+        for text in expected:
+            assert text in result.stdout, f"{text!r} not in output"
 
     finally:
         # Clean up
         try:
-            await docker_env.stop()
+            await docker_env.stop(timeout=0)
         except Exception as e:
             logger.warning(f"Failed to stop container: {e}")
 
 
-# Test 2: uv-pip-embed project with setup.py
+# Test 1: uv-pip-embed project with requirements.txt
 @injected_pytest(_design)
-async def test_uv_pip_embed_setuppy(
+async def test_uv_pip_embed_requirements(
     schematics_universal, new_PersistentDockerEnvFromSchematics, logger
 ):
-    """Test uv-pip-embed functionality with setup.py"""
-    logger.info("Testing uv-pip-embed with setup.py")
-
-    # Create project definition
-    project = ProjectDef(
-        dirs=[ProjectDir(id="test/dummy_projects/test_setuppy", kind="uv-pip-embed")]
+    """Test uv-pip-embed functionality with requirements.txt"""
+    await _check_uv_pip_embed(
+        "requirements", schematics_universal, new_PersistentDockerEnvFromSchematics, logger
     )
 
-    # Generate schematics
-    schematics = await schematics_universal(target=project, python_version="3.11")
 
-    # Create Docker environment
-    docker_env = new_PersistentDockerEnvFromSchematics(
-        project=project,
-        schematics=schematics,
-        docker_host="zeus",
-        container_name="test_uv_pip_embed_setuppy",
+# Test 2: uv-pip-embed project with setup.py
+@injected_pytest(_design)
+async def test_uv_pip_embed_setuppy(
+    schematics_universal, new_PersistentDockerEnvFromSchematics, logger
+):
+    """Test uv-pip-embed functionality with setup.py"""
+    await _check_uv_pip_embed(
+        "setuppy", schematics_universal, new_PersistentDockerEnvFromSchematics, logger
     )
-
-    # Ensure container is running
-    await docker_env.ensure_container()
-
-    try:
-        # Run test script
-        result = await docker_env.run_script(
-            """
-echo "Testing uv-pip-embed project with setup.py"
-echo "---"
-echo "Python version:"
-python --version
-echo "---"
-echo "UV version:"
-uv --version
-echo "---"
-echo "Installed packages:"
-pip list
-echo "---"
-echo "Which python:"
-which python
-echo "---"
-echo "Testing imports:"
-python -c "import numpy; print(f'numpy version: {numpy.__version__}')"
-python -c "import pandas; print(f'pandas version: {pandas.__version__}')"
-python -c "import test_setuppy; print('test_setuppy imported successfully')"
-"""
-        )
-
-        logger.info(f"Test result:\n{result.stdout}")
-
-        # Verify the test ran successfully
-        assert result is not None
-        assert "numpy version:" in result.stdout
-        assert "pandas version:" in result.stdout
-        assert "test_setuppy imported successfully" in result.stdout
-
-    finally:
-        # Clean up
-        try:
-            await docker_env.stop()
-        except Exception as e:
-            logger.warning(f"Failed to stop container: {e}")
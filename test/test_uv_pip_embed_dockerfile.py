@@ -1,27 +1,44 @@
 """Test to verify uv-pip-embed schematic generation"""
 
+import asyncio
 from pathlib import Path
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
+from ml_nexus.docker.builder.macros.macro_defs import RCopy
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
+from ml_nexus.rsync_util import RsyncArgs
+from ml_nexus.schematics import ContainerSchematic
 from loguru import logger
-
-# Configure static resolver for test directories
-_storage_resolver = StaticStorageResolver(
-    {
-        "test/dummy_projects/test_requirements": Path(__file__).parent
-        / "dummy_projects"
-        / "test_requirements",
-        "test/dummy_projects/test_setuppy": Path(__file__).parent
-        / "dummy_projects"
-        / "test_setuppy",
-    }
-)
+from test._common_design import SHARED_RESOLVER
 
 # Test design configuration
-_design = load_env_design + design(storage_resolver=_storage_resolver, logger=logger)
+_design = load_env_design + design(storage_resolver=SHARED_RESOLVER, logger=logger)
+
+
+# (project id, python_version) -> schematic. The per-project, comparison and
+# version sweep tests overlap on the 3.11 schematics and only inspect them.
+_SCHEMATICS: dict[tuple[str, str], ContainerSchematic] = {}
+
+
+async def _schematic(
+    schematics_universal, project_id: str, python_version: str
+) -> ContainerSchematic:
+    key = (project_id, python_version)
+    if key not in _SCHEMATICS:
+        _SCHEMATICS[key] = await schematics_universal(
+            target=ProjectDef(dirs=[ProjectDir(id=project_id, kind="uv-pip-embed")]),
+            python_version=python_version,
+        )
+    return _SCHEMATICS[key]
+
+
+def _flatten_macros(macros):
+    for macro in macros:
+        if isinstance(macro, list):
+            yield from _flatten_macros(macro)
+        else:
+            yield macro
 
 
 # Test 1: uv-pip-embed schematic generation with requirements.txt
@@ -30,15 +47,10 @@ async def test_uv_pip_embed_dockerfile_requirements(schematics_universal, logger
     """Test schematic generation for uv-pip-embed with requirements.txt"""
     logger.info("Testing uv-pip-embed schematic generation with requirements.txt")
 
-    # Create project
-    project = ProjectDef(
-        dirs=[
-            ProjectDir(id="test/dummy_projects/test_requirements", kind="uv-pip-embed")
-        ]
-    )
-
     # Generate schematics
-    schematics = await schematics_universal(target=project, python_version="3.11")
+    schematics = await _schematic(
+        schematics_universal, "test/dummy_projects/test_requirements", "3.11"
+    )
 
     # Verify builder components
     builder = schematics.builder
@@ -47,20 +59,22 @@ async def test_uv_pip_embed_dockerfile_requirements(schematics_universal, logger
     assert len(builder.macros) > 0
     assert len(builder.scripts) > 0
 
-    # Get entrypoint script to verify UV commands
-    entrypoint_script = await builder.a_entrypoint_script()
-
-    logger.info(f"Generated entrypoint script:\n{entrypoint_script[:500]}...")
-
-    # Verify script content
-    assert entrypoint_script is not None
-    assert len(entrypoint_script) > 0
-
     # Check for UV-specific commands in scripts
     scripts_str = " ".join(builder.scripts)
     assert "uv" in scripts_str or "UV" in scripts_str
     assert "pip" in scripts_str
 
+    # requirements.txt is copied (and installed) before the project sources, so
+    # editing the sources keeps the dependency layer cached
+    macros = list(_flatten_macros(builder.macros))
+    manifest_at = next(
+        i
+        for i, m in enumerate(macros)
+        if isinstance(m, RCopy) and Path(m.dst).name == "requirements.txt"
+    )
+    sources_at = next(i for i, m in enumerate(macros) if isinstance(m, RsyncArgs))
+    assert manifest_at < sources_at, "requirements.txt must be copied before sources"
+
     logger.info("✅ uv-pip-embed schematic with requirements.txt verified")
 
 
@@ -70,13 +84,10 @@ async def test_uv_pip_embed_dockerfile_setuppy(schematics_universal, logger):
     """Test schematic generation for uv-pip-embed with setup.py"""
     logger.info("Testing uv-pip-embed schematic generation with setup.py")
 
-    # Create project
-    project = ProjectDef(
-        dirs=[ProjectDir(id="test/dummy_projects/test_setuppy", kind="uv-pip-embed")]
-    )
-
     # Generate schematics
-    schematics = await schematics_universal(target=project, python_version="3.11")
+    schematics = await _schematic(
+        schematics_universal, "test/dummy_projects/test_setuppy", "3.11"
+    )
 
     # Verify builder components
     builder = schematics.builder
@@ -85,15 +96,6 @@ async def test_uv_pip_embed_dockerfile_setuppy(schematics_universal, logger):
     assert len(builder.macros) > 0
     assert len(builder.scripts) > 0
 
-    # Get entrypoint script to verify UV commands
-    entrypoint_script = await builder.a_entrypoint_script()
-
-    logger.info(f"Generated entrypoint script:\n{entrypoint_script[:500]}...")
-
-    # Verify script content
-    assert entrypoint_script is not None
-    assert len(entrypoint_script) > 0
-
     # Check for setup.py installation in scripts
     scripts_str = " ".join(builder.scripts)
     assert "uv" in scripts_str or "UV" in scripts_str
@@ -108,22 +110,12 @@ async def test_compare_uv_pip_embed_dockerfiles(schematics_universal, logger):
     """Compare schematic generation between requirements.txt and setup.py projects"""
     logger.info("Comparing uv-pip-embed schematics")
 
-    # Create projects
-    req_project = ProjectDef(
-        dirs=[
-            ProjectDir(id="test/dummy_projects/test_requirements", kind="uv-pip-embed")
-        ]
-    )
-    setup_project = ProjectDef(
-        dirs=[ProjectDir(id="test/dummy_projects/test_setuppy", kind="uv-pip-embed")]
-    )
-
     # Generate schematics
-    req_schematics = await schematics_universal(
-        target=req_project, python_version="3.11"
+    req_schematics = await _schematic(
+        schematics_universal, "test/dummy_projects/test_requirements", "3.11"
     )
-    setup_schematics = await schematics_universal(
-        target=setup_project, python_version="3.11"
+    setup_schematics = await _schematic(
+        schematics_universal, "test/dummy_projects/test_setuppy", "3.11"
     )
 
     # Get builders
@@ -141,8 +133,8 @@ async def test_compare_uv_pip_embed_dockerfiles(schematics_universal, logger):
     req_scripts_str = " ".join(req_builder.scripts)
     setup_scripts_str = " ".join(setup_builder.scripts)
 
-    assert "uv" in req_scripts_str.lower() or "UV" in req_scripts_str
-    assert "uv" in setup_scripts_str.lower() or "UV" in setup_scripts_str
+    assert "uv" in req_scripts_str.lower()
+    assert "uv" in setup_scripts_str.lower()
 
     # Requirements.txt specific
     assert "requirements.txt" in req_scripts_str or "requirements.txt" in req_script
@@ -153,31 +145,38 @@ async def test_compare_uv_pip_embed_dockerfiles(schematics_universal, logger):
     logger.info("✅ Schematic comparison complete")
 
 
-# Test 4: Test Python versions 3.10-3.13 with requirements.txt
-@injected_pytest(_design)
-async def test_uv_pip_embed_python_versions_requirements(schematics_universal, logger):
-    """Test uv-pip-embed with Python 3.10-3.13 for requirements.txt project"""
-    logger.info("Testing uv-pip-embed with Python 3.10-3.13 (requirements.txt)")
+# sweep name -> (project id, manifest label, substrings proving it is installed).
+# Both sweeps run the same checks for Python 3.10-3.13 on their project.
+_VERSION_SWEEPS = {
+    "requirements": (
+        "test/dummy_projects/test_requirements",
+        "requirements.txt",
+        ("requirements.txt",),
+    ),
+    "setuppy": (
+        "test/dummy_projects/test_setuppy",
+        "setup.py",
+        ("setup.py", "pip install -e"),
+    ),
+}
 
-    # Create project
-    project = ProjectDef(
-        dirs=[
-            ProjectDir(id="test/dummy_projects/test_requirements", kind="uv-pip-embed")
-        ]
-    )
+
+async def _sweep_python_versions(name, schematics_universal, logger):
+    """Check the sweep's project for Python 3.10-3.13 and assert that all passed"""
+    project_id, label, manifest_markers = _VERSION_SWEEPS[name]
+    logger.info(f"Testing uv-pip-embed with Python 3.10-3.13 ({label})")
 
     versions = ["3.10", "3.11", "3.12", "3.13"]
-    results = []
 
-    for version in versions:
+    async def check(version):
         logger.info(f"\n{'=' * 60}")
         logger.info(f"Testing Python {version}")
         logger.info(f"{'=' * 60}")
 
         try:
             # Generate schematics for this Python version
-            schematics = await schematics_universal(
-                target=project, python_version=version
+            schematics = await _schematic(
+                schematics_universal, project_id, version
             )
 
             builder = schematics.builder
@@ -186,41 +185,37 @@ async def test_uv_pip_embed_python_versions_requirements(schematics_universal, l
             logger.info(f"✓ Successfully created schematic for Python {version}")
             logger.info(f"  Base image: {builder.base_image}")
 
-            # Get entrypoint script
-            entrypoint_script = await builder.a_entrypoint_script()
-
             # Check for UV commands
             scripts_str = " ".join(builder.scripts)
-            assert "uv" in scripts_str.lower() or "UV" in scripts_str, (
+            assert "uv" in scripts_str.lower(), (
                 f"UV not found in scripts for Python {version}"
             )
             assert "pip" in scripts_str, (
                 f"pip not found in scripts for Python {version}"
             )
 
-            # Check for requirements.txt
-            all_content = scripts_str + " " + entrypoint_script
-            assert "requirements.txt" in all_content, (
-                f"requirements.txt not found for Python {version}"
+            # Check that the project's manifest gets installed. The entrypoint
+            # script only wraps these scripts, so they are searched directly.
+            assert any(marker in scripts_str for marker in manifest_markers), (
+                f"{label} installation not found for Python {version}"
             )
 
-            results.append(
-                {
-                    "version": version,
-                    "status": "✓ PASSED",
-                    "base_image": builder.base_image,
-                    "has_uv": "uv" in scripts_str.lower() or "UV" in scripts_str,
-                    "has_requirements": "requirements.txt" in all_content,
-                }
-            )
+            return {
+                "version": version,
+                "status": "✓ PASSED",
+                "base_image": builder.base_image,
+            }
 
         except Exception as e:
             logger.error(f"✗ Failed for Python {version}: {e!s}")
-            results.append({"version": version, "status": "✗ FAILED", "error": str(e)})
+            return {"version": version, "status": "✗ FAILED", "error": str(e)}
+
+    # The versions share no state, so their schematics are generated concurrently
+    results = await asyncio.gather(*[check(version) for version in versions])
 
     # Summary
     logger.info(f"\n{'=' * 60}")
-    logger.info("PYTHON VERSION TEST SUMMARY (requirements.txt)")
+    logger.info(f"PYTHON VERSION TEST SUMMARY ({label})")
     logger.info(f"{'=' * 60}")
 
     for result in results:
@@ -231,7 +226,8 @@ async def test_uv_pip_embed_python_versions_requirements(schematics_universal, l
                 f"Python {result['version']:4} {result['status']} - {result['base_image']}"
             )
 
-    passed = sum(1 for r in results if "PASSED" in r["status"])
+    # a failed check is the one result that carries an error
+    passed = sum("error" not in r for r in results)
     total = len(results)
     logger.info(f"\nTotal: {passed}/{total} passed")
 
@@ -239,86 +235,15 @@ async def test_uv_pip_embed_python_versions_requirements(schematics_universal, l
     assert passed == total, f"Only {passed}/{total} Python version tests passed"
 
 
+# Test 4: Test Python versions 3.10-3.13 with requirements.txt
+@injected_pytest(_design)
+async def test_uv_pip_embed_python_versions_requirements(schematics_universal, logger):
+    """Test uv-pip-embed with Python 3.10-3.13 for requirements.txt project"""
+    await _sweep_python_versions("requirements", schematics_universal, logger)
+
+
 # Test 5: Test Python versions 3.10-3.13 with setup.py
 @injected_pytest(_design)
 async def test_uv_pip_embed_python_versions_setuppy(schematics_universal, logger):
     """Test uv-pip-embed with Python 3.10-3.13 for setup.py project"""
-    logger.info("Testing uv-pip-embed with Python 3.10-3.13 (setup.py)")
-
-    # Create project
-    project = ProjectDef(
-        dirs=[ProjectDir(id="test/dummy_projects/test_setuppy", kind="uv-pip-embed")]
-    )
-
-    versions = ["3.10", "3.11", "3.12", "3.13"]
-    results = []
-
-    for version in versions:
-        logger.info(f"\n{'=' * 60}")
-        logger.info(f"Testing Python {version}")
-        logger.info(f"{'=' * 60}")
-
-        try:
-            # Generate schematics for this Python version
-            schematics = await schematics_universal(
-                target=project, python_version=version
-            )
-
-            builder = schematics.builder
-            assert builder is not None
-
-            logger.info(f"✓ Successfully created schematic for Python {version}")
-            logger.info(f"  Base image: {builder.base_image}")
-
-            # Get entrypoint script
-            entrypoint_script = await builder.a_entrypoint_script()
-
-            # Check for UV commands
-            scripts_str = " ".join(builder.scripts)
-            assert "uv" in scripts_str.lower() or "UV" in scripts_str, (
-                f"UV not found in scripts for Python {version}"
-            )
-            assert "pip" in scripts_str, (
-                f"pip not found in scripts for Python {version}"
-            )
-
-            # Check for setup.py
-            all_content = scripts_str + " " + entrypoint_script
-            assert "setup.py" in all_content or "pip install -e" in all_content, (
-                f"setup.py installation not found for Python {version}"
-            )
-
-            results.append(
-                {
-                    "version": version,
-                    "status": "✓ PASSED",
-                    "base_image": builder.base_image,
-                    "has_uv": "uv" in scripts_str.lower() or "UV" in scripts_str,
-                    "has_setup": "setup.py" in all_content
-                    or "pip install -e" in all_content,
-                }
-            )
-
-        except Exception as e:
-            logger.error(f"✗ Failed for Python {version}: {e!s}")
-            results.append({"version": version, "status": "✗ FAILED", "error": str(e)})
-
-    # Summary
-    logger.info(f"\n{'=' * 60}")
-    logger.info("PYTHON VERSION TEST SUMMARY (setup.py)")
-    logger.info(f"{'=' * 60}")
-
-    for result in results:
-        if "error" in result:
-            logger.info(f"Python {result['version']:4} {result['status']}")
-        else:
-            logger.info(
-                f"Python {result['version']:4} {result['status']} - {result['base_image']}"
-            )
-
-    passed = sum(1 for r in results if "PASSED" in r["status"])
-    total = len(results)
-    logger.info(f"\nTotal: {passed}/{total} passed")
-
-    # Assert all tests passed
-    assert passed == total, f"Only {passed}/{total} Python version tests passed"
+    await _sweep_python_versions("setuppy", schematics_universal, logger)
@@ -1,6 +1,8 @@
 """Test to verify uv-pip-embed schematic generation content"""
 
+import atexit
 from pathlib import Path
+import shutil
 import tempfile
 from pinjected import design
 from pinjected.test import injected_pytest
@@ -9,11 +11,18 @@ from ml_nexus.project_structure import ProjectDef, ProjectDir
 from ml_nexus.storage_resolver import StaticStorageResolver
 
 
+def _temp_project(name: str) -> Path:
+    """Create an empty project dir in a temp dir removed at process exit"""
+    tmpdir = Path(tempfile.mkdtemp())
+    # removed when the (xdist worker) process exits instead of piling up in /tmp
+    atexit.register(shutil.rmtree, tmpdir, ignore_errors=True)
+    project_path = tmpdir / name
+    project_path.mkdir()
+    return project_path
+
+
 # Create temporary directories for test projects
-tmpdir_requirements = tempfile.mkdtemp()
-tmppath_requirements = Path(tmpdir_requirements)
-test_project_path_requirements = tmppath_requirements / "test_project"
-test_project_path_requirements.mkdir()
+test_project_path_requirements = _temp_project("test_project")
 
 requirements_file = test_project_path_requirements / "requirements.txt"
 requirements_file.write_text("requests==2.31.0\nnumpy==1.26.2\npandas==2.1.4\n")
@@ -26,10 +35,7 @@ test_design_requirements = load_env_design + design(
 )
 
 
-tmpdir_setuppy = tempfile.mkdtemp()
-tmppath_setuppy = Path(tmpdir_setuppy)
-test_project_path_setuppy = tmppath_setuppy / "setup_project"
-test_project_path_setuppy.mkdir()
+test_project_path_setuppy = _temp_project("setup_project")
 
 # Create setup.py
 (test_project_path_setuppy / "setup.py").write_text("""
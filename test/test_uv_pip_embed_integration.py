@@ -1,28 +1,21 @@
 """Integration tests for uv-pip-embed functionality"""
 
-from pathlib import Path
+import pytest
 from pinjected import design
 from pinjected.test import injected_pytest
 from ml_nexus import load_env_design
 from ml_nexus.project_structure import ProjectDef, ProjectDir
-from ml_nexus.storage_resolver import StaticStorageResolver
-
-# Storage resolver for test projects
-_dir = Path(__file__).parent / "dummy_projects"
-_storage_resolver = StaticStorageResolver(
-    {
-        "test/dummy_projects/test_requirements": _dir / "test_requirements",
-        "test/dummy_projects/test_setuppy": _dir / "test_setuppy",
-    }
-)
+from test._common_design import SHARED_RESOLVER
+from test.container_pool import session_container_name
 
 # Test design configuration
 _design = load_env_design + design(
-    storage_resolver=_storage_resolver, ml_nexus_docker_build_context="zeus"
+    storage_resolver=SHARED_RESOLVER, ml_nexus_docker_build_context="zeus"
 )
 
 
 # Test 1: uv-pip-embed with requirements.txt
+@pytest.mark.zeus
 @injected_pytest(_design)
 async def test_uv_pip_embed_requirements(
     schematics_universal, a_PersistentDockerEnvFromSchematics, logger
@@ -45,7 +38,7 @@ async def test_uv_pip_embed_requirements(
         project=project,
         schematics=schematics,
         docker_host="zeus",
-        container_name="test_uv_pip_embed_requirements",
+        container_name=session_container_name("test_uv_pip_embed_integration_requirements"),
     )
 
     # Start the container
@@ -94,6 +87,7 @@ print('✅ All imports successful!')
 
 
 # Test 2: uv-pip-embed with setup.py
+@pytest.mark.zeus
 @injected_pytest(_design)
 async def test_uv_pip_embed_setuppy(
     schematics_universal, a_PersistentDockerEnvFromSchematics, logger
@@ -114,7 +108,7 @@ async def test_uv_pip_embed_setuppy(
         project=project,
         schematics=schematics,
         docker_host="zeus",
-        container_name="test_uv_pip_embed_setuppy",
+        container_name=session_container_name("test_uv_pip_embed_integration_setuppy"),
     )
 
     # Start the container
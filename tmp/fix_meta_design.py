@@ -20,6 +20,11 @@ files_to_fix = [
     "test/test_schematics_working_kinds.py",
 ]
 
+# __meta_design__ assignments, commented out below
+META_DESIGN_RE = re.compile(r'^(__meta_design__\s*=.*?)$', re.MULTILINE)
+# `<name>_design = design(` lines that still need load_env_design prepended
+DESIGN_DECL_RE = re.compile(r'^(\w+_design\s*=\s*)(design\()', re.MULTILINE)
+
 for file_path in files_to_fix:
     path = Path(file_path)
     if not path.exists():
@@ -29,22 +34,14 @@ for file_path in files_to_fix:
     content = path.read_text()
     
     # Replace __meta_design__ = with comment
-    new_content = re.sub(
-        r'^(__meta_design__\s*=.*?)$',
-        r'# \1  # Removed deprecated __meta_design__',
-        content,
-        flags=re.MULTILINE
+    new_content = META_DESIGN_RE.sub(
+        r'# \1  # Removed deprecated __meta_design__', content
     )
     
     # Check if design definition needs load_env_design
     if 'load_env_design' not in new_content and 'design(' in new_content:
         # Find the line with design( and ensure it includes load_env_design
-        new_content = re.sub(
-            r'^(\w+_design\s*=\s*)(design\()',
-            r'\1load_env_design + \2',
-            new_content,
-            flags=re.MULTILINE
-        )
+        new_content = DESIGN_DECL_RE.sub(r'\1load_env_design + \2', new_content)
     
     if new_content != content:
         path.write_text(new_content)